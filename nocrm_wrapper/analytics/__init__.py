@@ -0,0 +1,3 @@
+from .pipeline_analytics import PipelineAnalytics, PipelineAggregate
+
+__all__ = ['PipelineAnalytics', 'PipelineAggregate']
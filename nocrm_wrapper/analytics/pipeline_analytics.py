@@ -0,0 +1,249 @@
+from bisect import bisect_right, insort
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import AsyncIterable, Dict, List, Optional, Sequence, Tuple, Union
+
+from ..models import Lead, LeadEvent
+from ..repositories.lead_repository import LeadRepository
+
+DEFAULT_AGE_BUCKETS = (7, 30, 90, 180)
+
+
+@dataclass
+class PipelineAggregate:
+    """
+    Agregados de un grupo de leads (un paso o un pipeline).
+
+    Attributes:
+        count: Cantidad de leads
+        amount: Suma de montos
+        weighted: Forecast ponderado (monto × probabilidad / 100)
+        created: Timestamps de creación ordenados, usados para el histograma de antigüedad
+    """
+    count: int = 0
+    amount: float = 0.0
+    weighted: float = 0.0
+    created: List[float] = field(default_factory=list)
+
+    def _add(self, amount: float, weighted: float, created: Optional[float]) -> None:
+        self.count += 1
+        self.amount += amount
+        self.weighted += weighted
+        if created is not None:
+            insort(self.created, created)
+
+    def _remove(self, amount: float, weighted: float, created: Optional[float]) -> None:
+        self.count -= 1
+        self.amount -= amount
+        self.weighted -= weighted
+        if created is not None:
+            index = bisect_right(self.created, created) - 1
+            if index >= 0 and self.created[index] == created:
+                del self.created[index]
+
+    def age_histogram(self, now: float, buckets: Sequence[int] = DEFAULT_AGE_BUCKETS) -> Dict[str, int]:
+        """
+        Cuenta los leads por antigüedad (en días) al instante `now`.
+
+        Args:
+            now: Instante de referencia (timestamp)
+            buckets: Límites superiores de cada rango, en días
+
+        Returns:
+            Dict con una clave por rango ("<7d", "7-30d", ..., ">=180d")
+        """
+        histogram: Dict[str, int] = {}
+        upper_index = len(self.created)
+        lower = 0
+        for limit in buckets:
+            # Leads creados después de now - limit días tienen antigüedad < limit
+            index = bisect_right(self.created, now - limit * 86400)
+            label = f"<{limit}d" if lower == 0 else f"{lower}-{limit}d"
+            histogram[label] = upper_index - index
+            upper_index = index
+            lower = limit
+        histogram[f">={lower}d"] = upper_index
+        return histogram
+
+    def to_dict(self, now: float, buckets: Sequence[int] = DEFAULT_AGE_BUCKETS) -> Dict:
+        """Snapshot serializable del agregado"""
+        return {
+            'count': self.count,
+            'amount': self.amount,
+            'weighted': self.weighted,
+            'age_histogram': self.age_histogram(now, buckets),
+        }
+
+
+class PipelineAnalytics:
+    """
+    Analítica incremental del pipeline de ventas.
+
+    Mantiene por paso y por pipeline la cantidad de leads, la suma de montos,
+    el forecast ponderado (monto × probabilidad) y un histograma de antigüedad.
+    Cada lead aplicado reemplaza su contribución anterior, por lo que refrescar
+    un dashboard solo requiere procesar los leads que cambiaron. Las versiones
+    con un `updated_at` anterior al ya aplicado se ignoran, así que los eventos
+    que llegan desordenados no restauran un estado viejo.
+
+    Implementa `apply_event`, así que puede conectarse directamente a un
+    `WebhookReceiver` o a cualquier fuente de LeadEvent.
+
+    Args:
+        steps: Pasos disponibles (respuesta de `list_steps`)
+        pipelines: Pipelines disponibles (respuesta de `list_pipelines`)
+        age_buckets: Límites en días del histograma de antigüedad
+
+    Example:
+        >>> analytics = await PipelineAnalytics.from_repository(client.repository)
+        >>> analytics.apply_many(await client.leads.list())
+        >>> receiver.attach(analytics)
+        >>> analytics.by_pipeline()
+    """
+
+    def __init__(self,
+                 steps: List[dict],
+                 pipelines: List[dict],
+                 age_buckets: Sequence[int] = DEFAULT_AGE_BUCKETS):
+        self.age_buckets = tuple(age_buckets)
+        self._step_pipeline: Dict[str, Optional[int]] = {s['name']: s.get('pipeline_id') for s in steps}
+        self._pipeline_names: Dict[int, str] = {p['id']: p.get('name') for p in pipelines}
+        # lead_id -> (paso, pipeline_id, monto, ponderado, creado, actualizado)
+        self._contributions: Dict[int, Tuple[str, Optional[int], float, float, Optional[float], Optional[float]]] = {}
+        self._steps: Dict[str, PipelineAggregate] = {}
+        self._pipelines: Dict[Optional[int], PipelineAggregate] = {}
+
+    @classmethod
+    async def from_repository(cls, repository: LeadRepository, **options) -> 'PipelineAnalytics':
+        """
+        Crea la analítica cargando pasos y pipelines desde la API.
+
+        Args:
+            repository: Repositorio de leads
+            **options: Opciones adicionales del constructor (age_buckets)
+
+        Returns:
+            PipelineAnalytics: Instancia sin leads aplicados
+        """
+        steps = await repository.list_steps()
+        pipelines = await repository.list_pipelines()
+        return cls(steps, pipelines, **options)
+
+    def __len__(self) -> int:
+        return len(self._contributions)
+
+    def apply(self, lead: Lead) -> None:
+        """
+        Incorpora (o actualiza) un lead en los agregados.
+
+        Si el lead ya estaba registrado con un `updated_at` posterior, la
+        versión recibida se ignora.
+
+        Args:
+            lead: Lead con su estado actual; debe tener `id`
+        """
+        if lead.id is None:
+            raise ValueError("Leads must have an id to be tracked")
+        updated = lead.updated_at.timestamp() if lead.updated_at else None
+        previous = self._contributions.get(lead.id)
+        if previous is not None and previous[5] is not None and updated is not None and updated < previous[5]:
+            return
+        self.remove(lead.id)
+
+        amount = float(lead.amount or 0.0)
+        weighted = amount * (lead.probability or 0) / 100
+        created = lead.created_at.timestamp() if lead.created_at else None
+        pipeline_id = self._step_pipeline.get(lead.status)
+
+        contribution = (lead.status, pipeline_id, amount, weighted, created, updated)
+        self._contributions[lead.id] = contribution
+        self._steps.setdefault(lead.status, PipelineAggregate())._add(amount, weighted, created)
+        self._pipelines.setdefault(pipeline_id, PipelineAggregate())._add(amount, weighted, created)
+
+    def apply_many(self, leads: Sequence[Lead]) -> None:
+        """Incorpora varios leads"""
+        for lead in leads:
+            self.apply(lead)
+
+    def remove(self, lead_id: int) -> None:
+        """
+        Retira la contribución de un lead (si estaba registrado).
+
+        Args:
+            lead_id: ID del lead
+        """
+        contribution = self._contributions.pop(lead_id, None)
+        if contribution is None:
+            return
+        step, pipeline_id, amount, weighted, created, _ = contribution
+        for aggregates, key in ((self._steps, step), (self._pipelines, pipeline_id)):
+            aggregate = aggregates[key]
+            aggregate._remove(amount, weighted, created)
+            if aggregate.count == 0:
+                del aggregates[key]
+
+    def apply_event(self, event: LeadEvent) -> None:
+        """
+        Aplica un evento de cambio: retira los leads eliminados y actualiza el
+        resto (ignorando los eventos más antiguos que el estado aplicado).
+
+        Args:
+            event: Evento de cambio de lead
+        """
+        if event.lead_id is None:
+            return
+        if event.type == LeadEvent.DELETED:
+            self.remove(event.lead_id)
+        else:
+            self.apply(event.lead)
+
+    async def consume(self, stream: AsyncIterable[Union[Lead, LeadEvent]]) -> None:
+        """
+        Consume un flujo asíncrono de leads o eventos hasta que termine.
+
+        Args:
+            stream: Iterable asíncrono de Lead o LeadEvent
+        """
+        async for item in stream:
+            if isinstance(item, LeadEvent):
+                self.apply_event(item)
+            else:
+                self.apply(item)
+
+    def _now(self, now: Optional[datetime]) -> float:
+        return (now or datetime.now(timezone.utc)).timestamp()
+
+    def by_step(self, now: Optional[datetime] = None) -> Dict[str, Dict]:
+        """
+        Agregados por paso.
+
+        Args:
+            now: Instante de referencia para la antigüedad (por defecto, ahora)
+
+        Returns:
+            Dict[str, Dict]: Por nombre de paso, los agregados y su pipeline_id
+        """
+        reference = self._now(now)
+        return {
+            step: dict(aggregate.to_dict(reference, self.age_buckets),
+                       pipeline_id=self._step_pipeline.get(step))
+            for step, aggregate in self._steps.items()
+        }
+
+    def by_pipeline(self, now: Optional[datetime] = None) -> Dict[Optional[int], Dict]:
+        """
+        Agregados por pipeline. Los leads cuyo paso no pertenece a ningún
+        pipeline conocido se agrupan bajo la clave None.
+
+        Args:
+            now: Instante de referencia para la antigüedad (por defecto, ahora)
+
+        Returns:
+            Dict: Por ID de pipeline, los agregados y el nombre del pipeline
+        """
+        reference = self._now(now)
+        return {
+            pipeline_id: dict(aggregate.to_dict(reference, self.age_buckets),
+                              name=self._pipeline_names.get(pipeline_id))
+            for pipeline_id, aggregate in self._pipelines.items()
+        }
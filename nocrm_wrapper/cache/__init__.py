@@ -0,0 +1,4 @@
+from .ttl_cache import TTLCache
+from .duplicate_index import LeadDuplicateIndex
+
+__all__ = ['TTLCache', 'LeadDuplicateIndex']
@@ -0,0 +1,302 @@
+import json
+import math
+import re
+import unicodedata
+from collections import Counter, defaultdict
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from ..models.lead import Lead
+from ..models.lead_event import LeadEvent
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+
+def normalize(text: Optional[str]) -> str:
+    """
+    Normaliza un texto para comparar leads: minúsculas, sin acentos ni
+    puntuación y con los espacios colapsados.
+
+    Example:
+        >>> normalize("  Implementación CRM - ACME S.A. ")
+        'implementacion crm acme s a'
+    """
+    if not text:
+        return ""
+    text = unicodedata.normalize("NFKD", text)
+    text = "".join(c for c in text if not unicodedata.combining(c)).lower()
+    return _NON_ALNUM.sub(" ", text).strip()
+
+
+def trigrams(text: str) -> FrozenSet[str]:
+    """Conjunto de trigramas de un texto normalizado (con relleno en los bordes)"""
+    if not text:
+        return frozenset()
+    padded = f"  {text} "
+    return frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+
+
+class LeadDuplicateIndex:
+    """
+    Índice en memoria para detectar leads probablemente duplicados sin consultar la API.
+
+    Indexa cada lead por título y `contact_name` normalizados: las claves
+    idénticas se resuelven con un diccionario y las parecidas con un índice
+    invertido de trigramas y similitud de Jaccard. Con filtros de tamaño y de
+    prefijo solo se examinan los leads que comparten alguno de los trigramas
+    menos frecuentes de la consulta, así que el costo depende de cuántos leads
+    se parecen de verdad y no del tamaño del índice.
+
+    Para que dos creaciones concurrentes del mismo lead no pasen ambas la
+    verificación, `reserve` registra la clave del candidato antes de llamar a
+    la API y `release` la libera cuando la creación termina.
+
+    Se mantiene actualizado con `add` (p. ej. tras crear leads), `remove` y
+    `apply_event`, por lo que puede conectarse a un WebhookReceiver, al change
+    feed o a un `MirrorSink` de la sincronización completa. Opcionalmente se
+    guarda y carga desde disco.
+
+    Args:
+        threshold: Similitud mínima (0-1) para considerar un lead duplicado
+
+    Example:
+        >>> index = LeadDuplicateIndex(threshold=0.8)
+        >>> index.add_many(await client.repository.list())
+        >>> index.find_duplicates(Lead(title="Implementacion CRM", status="new"))
+        [(123, 0.92)]
+    """
+
+    def __init__(self, threshold: float = 0.8):
+        if not 0 < threshold <= 1:
+            raise ValueError("Duplicate threshold must be between 0 and 1")
+        self.threshold = threshold
+        self._entries: Dict[int, Tuple[str, str]] = {}
+        self._exact: Dict[Tuple[str, str], Set[int]] = defaultdict(set)
+        # trigrama -> cantidad de trigramas del lead -> ids
+        self._postings: Dict[str, Dict[int, Set[int]]] = defaultdict(dict)
+        self._frequency: Counter = Counter()
+        self._sizes: Counter = Counter()
+        self._grams: Dict[int, FrozenSet[str]] = {}
+        self._pending: Set[int] = set()
+        self._next_reservation = 0
+
+    def __len__(self) -> int:
+        return len(self._entries) - len(self._pending)
+
+    def __contains__(self, lead_id: int) -> bool:
+        return lead_id in self._entries
+
+    @staticmethod
+    def _key(title: Optional[str], contact_name: Optional[str]) -> Tuple[str, str]:
+        return normalize(title), normalize(contact_name)
+
+    @staticmethod
+    def _grams_for(key: Tuple[str, str]) -> FrozenSet[str]:
+        title, contact = key
+        return trigrams(f"{title} {contact}".strip())
+
+    def add(self, lead: Lead) -> None:
+        """
+        Indexa (o reindexa) un lead.
+
+        Args:
+            lead: Lead a indexar; debe tener `id`
+        """
+        if lead.id is None:
+            raise ValueError("Leads must have an id to be indexed")
+        self.remove(lead.id)
+        key = self._key(lead.title, lead.contact_name)
+        grams = self._grams_for(key)
+        self._entries[lead.id] = key
+        self._exact[key].add(lead.id)
+        self._grams[lead.id] = grams
+        self._sizes[len(grams)] += 1
+        for gram in grams:
+            self._postings[gram].setdefault(len(grams), set()).add(lead.id)
+            self._frequency[gram] += 1
+
+    def add_many(self, leads: Iterable[Lead]) -> None:
+        """Indexa varios leads"""
+        for lead in leads:
+            self.add(lead)
+
+    def write(self, leads: List[Lead]) -> None:
+        """Interfaz de sink de sincronización: indexa un lote de leads"""
+        self.add_many(leads)
+
+    def remove(self, lead_id: int) -> None:
+        """
+        Elimina un lead del índice (si estaba indexado).
+
+        Args:
+            lead_id: ID del lead
+        """
+        key = self._entries.pop(lead_id, None)
+        if key is None:
+            return
+        ids = self._exact[key]
+        ids.discard(lead_id)
+        if not ids:
+            del self._exact[key]
+        grams = self._grams.pop(lead_id)
+        size = len(grams)
+        self._sizes[size] -= 1
+        if not self._sizes[size]:
+            del self._sizes[size]
+        for gram in grams:
+            by_size = self._postings[gram]
+            by_size[size].discard(lead_id)
+            if not by_size[size]:
+                del by_size[size]
+                if not by_size:
+                    del self._postings[gram]
+            self._frequency[gram] -= 1
+            if not self._frequency[gram]:
+                del self._frequency[gram]
+
+    def reserve(self, lead: Lead) -> int:
+        """
+        Reserva la clave de un lead que todavía se está creando.
+
+        Mientras la reserva exista, `find_duplicates` la reporta como
+        coincidencia con id None.
+
+        Args:
+            lead: Lead candidato (no necesita id)
+
+        Returns:
+            int: Token de la reserva, para pasar a `release`
+        """
+        self._next_reservation -= 1
+        token = self._next_reservation
+        self.add(Lead(title=lead.title, status=lead.status, contact_name=lead.contact_name, id=token))
+        self._pending.add(token)
+        return token
+
+    def release(self, token: int) -> None:
+        """
+        Libera una reserva hecha con `reserve`.
+
+        Args:
+            token: Token devuelto por `reserve`
+        """
+        if token in self._pending:
+            self._pending.discard(token)
+            self.remove(token)
+
+    def apply_event(self, event: LeadEvent) -> None:
+        """
+        Mantiene el índice actualizado a partir de un evento de cambio.
+
+        Args:
+            event: Evento de cambio de lead
+        """
+        if event.lead_id is None:
+            return
+        if event.type == LeadEvent.DELETED:
+            self.remove(event.lead_id)
+        else:
+            self.add(event.lead)
+
+    def find_duplicates(self,
+                        lead: Lead,
+                        threshold: Optional[float] = None,
+                        limit: int = 5) -> List[Tuple[Optional[int], float]]:
+        """
+        Busca leads indexados probablemente duplicados de `lead`.
+
+        Args:
+            lead: Lead candidato (no necesita id)
+            threshold: Similitud mínima (por defecto, la del índice)
+            limit: Máximo de resultados
+
+        Returns:
+            List[Tuple[Optional[int], float]]: (id, similitud) ordenados de mayor
+            a menor similitud; las coincidencias exactas tienen similitud 1.0 y
+            las reservas pendientes tienen id None
+        """
+        threshold = self.threshold if threshold is None else threshold
+        key = self._key(lead.title, lead.contact_name)
+        scores: Dict[int, float] = {id: 1.0 for id in self._exact.get(key, ())}
+
+        grams = self._grams_for(key)
+        if grams:
+            for id in self._candidates(grams, threshold):
+                if id in scores:
+                    continue
+                other = self._grams[id]
+                common = len(grams & other)
+                similarity = common / (len(grams) + len(other) - common)
+                if similarity >= threshold:
+                    scores[id] = similarity
+
+        if lead.id is not None:
+            scores.pop(lead.id, None)
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0] in self._pending, item[0]))
+        return [(None if id in self._pending else id, similarity) for id, similarity in ranked[:limit]]
+
+    def _candidates(self, grams: FrozenSet[str], threshold: float) -> Set[int]:
+        """
+        Leads que pueden alcanzar `threshold` de similitud con `grams`.
+
+        Un lead de n trigramas con similitud de Jaccard >= t comparte al menos
+        o = ceil(t·(|grams| + n) / (1 + t)) trigramas con la consulta, así que
+        tiene alguno de los |grams| - o + 1 trigramas menos frecuentes de la
+        consulta (filtro de prefijo). Como las listas están separadas por
+        tamaño, para cada n compatible solo se recorren esos trigramas raros y
+        el costo no crece con las palabras que comparten muchos leads. Cada
+        trigrama extra que se recorre exige un acierto más a los candidatos
+        (filtro de conteo), mientras sus listas no sumen más que los
+        candidatos a verificar.
+        """
+        ordered = sorted(grams, key=self._frequency.__getitem__)
+        low = threshold * len(grams) - 1e-9
+        high = len(grams) / threshold + 1e-9
+        candidates: Set[int] = set()
+        for size in self._sizes:
+            if not low <= size <= high:
+                continue
+            overlap = math.ceil(threshold * (len(grams) + size) / (1 + threshold) - 1e-9)
+            prefix = len(grams) - overlap + 1
+            hits: Counter = Counter()
+            for gram in ordered[:prefix]:
+                hits.update(self._postings.get(gram, {}).get(size, ()))
+            required, budget = 1, len(hits)
+            for gram in ordered[prefix:]:
+                ids = self._postings.get(gram, {}).get(size, ())
+                budget -= len(ids)
+                if budget < 0:
+                    break
+                hits.update(ids)
+                required += 1
+            candidates.update(id for id, count in hits.items() if count >= required)
+        return candidates
+
+    def save(self, path: str) -> None:
+        """
+        Guarda el índice en disco (solo las claves normalizadas; los trigramas se recalculan al cargar).
+
+        Args:
+            path: Ruta del archivo JSON
+        """
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"threshold": self.threshold,
+                       "entries": {str(id): list(key) for id, key in self._entries.items()
+                                   if id not in self._pending}}, f)
+
+    @classmethod
+    def load(cls, path: str) -> 'LeadDuplicateIndex':
+        """
+        Carga un índice guardado con `save`.
+
+        Args:
+            path: Ruta del archivo JSON
+
+        Returns:
+            LeadDuplicateIndex: Índice reconstruido
+        """
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        index = cls(threshold=data["threshold"])
+        for id, (title, contact) in data["entries"].items():
+            index.add(Lead(title=title, status="", contact_name=contact or None, id=int(id)))
+        return index
@@ -0,0 +1,100 @@
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+from ..models.lead_event import LeadEvent
+
+
+class TTLCache:
+    """
+    Caché en memoria con expiración por tiempo (TTL) y tamaño máximo opcional.
+
+    Además de la interfaz clásica get/set/invalidate, implementa `apply_event`
+    para que los receptores de cambios (webhooks, change feeds) la mantengan
+    actualizada sin esperar a que expiren las entradas.
+
+    Args:
+        ttl: Segundos que una entrada permanece válida
+        maxsize: Cantidad máxima de entradas (None = sin límite). Al superarse
+            se descarta la entrada usada menos recientemente.
+        clock: Función que devuelve el tiempo actual en segundos (útil en tests)
+
+    Example:
+        >>> cache = TTLCache(ttl=60)
+        >>> cache.set(123, lead)
+        >>> cache.get(123)
+    """
+
+    def __init__(self,
+                 ttl: float = 300.0,
+                 maxsize: Optional[int] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        if ttl <= 0:
+            raise ValueError("Cache TTL must be positive")
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._clock = clock
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Devuelve el valor asociado a `key` o `default` si no existe o expiró"""
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Guarda `value` bajo `key` reiniciando su TTL"""
+        self._data[key] = (self._clock() + self.ttl, value)
+        self._data.move_to_end(key)
+        if self.maxsize is not None:
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Elimina la entrada `key` si existe"""
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Elimina todas las entradas"""
+        self._data.clear()
+
+    def apply_event(self, event: LeadEvent) -> None:
+        """
+        Actualiza la caché a partir de un evento de cambio de lead.
+
+        Los leads eliminados se invalidan. Los creados o actualizados solo
+        reemplazan entradas ya cacheadas (la caché no crece con cada evento) y
+        se ignoran si son más antiguos que la versión cacheada, por lo que los
+        eventos que llegan desordenados no pisan datos más nuevos.
+
+        Args:
+            event: Evento de cambio a aplicar
+        """
+        if event.lead_id is None:
+            return
+        if event.type == LeadEvent.DELETED:
+            self.invalidate(event.lead_id)
+            return
+        cached = self.get(event.lead_id)
+        if cached is None:
+            return
+        cached_at = getattr(cached, "updated_at", None)
+        updated_at = event.lead.updated_at
+        if cached_at is not None and updated_at is not None and updated_at < cached_at:
+            return
+        self.set(event.lead_id, event.lead)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+_MISSING = object()
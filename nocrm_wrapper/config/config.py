@@ -9,6 +9,15 @@ class NoCRMConfig:
     subdomain: str
     base_url: Optional[str] = None
     timeout: int = 30
+    cache_ttl: Optional[float] = None
+    cache_maxsize: Optional[int] = 10000
+    reference_cache_ttl: Optional[float] = None
+    pool_size: int = 10
+    rate_limit: Optional[float] = None
+    adaptive_concurrency: bool = False
+    max_concurrency: int = 100
+    offload_threshold: Optional[int] = None
+    offload_workers: Optional[int] = None
 
     def __post_init__(self):
         """Validación post inicialización y configuración de la URL base"""
@@ -22,4 +31,25 @@ class NoCRMConfig:
         if not self.base_url:
             self.base_url = f"https://{self.subdomain}.nocrm.io/api/v2"
         elif not self.base_url.startswith(("http://", "https://")):
-            raise ValueError("Invalid base URL format")
\ No newline at end of file
+            raise ValueError("Invalid base URL format")
+
+        if self.cache_ttl is not None and self.cache_ttl <= 0:
+            raise ValueError("Cache TTL must be positive")
+
+        if self.cache_maxsize is not None and self.cache_maxsize < 1:
+            raise ValueError("Cache maxsize must be at least 1")
+
+        if self.reference_cache_ttl is not None and self.reference_cache_ttl <= 0:
+            raise ValueError("Reference cache TTL must be positive")
+
+        if self.pool_size < 1:
+            raise ValueError("Pool size must be at least 1")
+
+        if self.rate_limit is not None and self.rate_limit <= 0:
+            raise ValueError("Rate limit must be positive")
+
+        if self.max_concurrency < 1:
+            raise ValueError("Max concurrency must be at least 1")
+
+        if self.offload_threshold is not None and self.offload_threshold < 0:
+            raise ValueError("Offload threshold cannot be negative")
\ No newline at end of file
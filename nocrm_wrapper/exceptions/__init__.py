@@ -2,12 +2,16 @@ from .nocrm_exceptions import (
     NoCRMException,
     NoCRMAuthenticationError,
     NoCRMValidationError,
-    NoCRMAPIError
+    NoCRMDuplicateLeadError,
+    NoCRMAPIError,
+    NoCRMTimeoutError
 )
 
 __all__ = [
     'NoCRMException',
     'NoCRMAuthenticationError',
     'NoCRMValidationError',
-    'NoCRMAPIError'
+    'NoCRMDuplicateLeadError',
+    'NoCRMAPIError',
+    'NoCRMTimeoutError'
 ]
\ No newline at end of file
@@ -10,8 +10,18 @@ class NoCRMValidationError(NoCRMException):
     """Raised when input validation fails"""
     pass
 
+class NoCRMDuplicateLeadError(NoCRMValidationError):
+    """Raised when a lead to be created likely duplicates an existing one"""
+    def __init__(self, message: str, matches: list = None):
+        super().__init__(message)
+        self.matches = matches or []
+
 class NoCRMAPIError(NoCRMException):
     """Raised when the API returns an error"""
     def __init__(self, message: str, status_code: int = None):
         super().__init__(message)
-        self.status_code = status_code
\ No newline at end of file
+        self.status_code = status_code
+
+class NoCRMTimeoutError(NoCRMAPIError):
+    """Raised when a request or composite operation exceeds its deadline"""
+    pass
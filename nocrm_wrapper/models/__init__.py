@@ -1,3 +1,9 @@
 from .lead import Lead
+from .lead_event import LeadEvent
+from .resource import ResourceModel
+from .user import User
+from .team import Team
+from .activity import Activity
+from .custom_field import CustomField
 
-__all__ = ['Lead']
\ No newline at end of file
+__all__ = ['Lead', 'LeadEvent', 'ResourceModel', 'User', 'Team', 'Activity', 'CustomField']
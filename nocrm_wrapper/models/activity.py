@@ -0,0 +1,26 @@
+from dataclasses import dataclass
+from typing import Optional
+from datetime import datetime
+
+from .resource import ResourceModel
+
+
+@dataclass
+class Activity(ResourceModel):
+    """
+    Representa un tipo de actividad de NoCRM (llamada, email, reunión, etc.).
+
+    Attributes:
+        name: Nombre de la actividad
+        kind: Tipo de actividad (call, email, meeting, ...)
+        is_archived: Indica si la actividad está archivada
+        id: ID único de la actividad en NoCRM
+        created_at: Fecha/hora de creación
+        updated_at: Fecha/hora de última actualización
+    """
+    name: Optional[str] = None
+    kind: Optional[str] = None
+    is_archived: Optional[bool] = None
+    id: Optional[int] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
@@ -0,0 +1,28 @@
+from dataclasses import dataclass
+from typing import Optional, List
+from datetime import datetime
+
+from .resource import ResourceModel
+
+
+@dataclass
+class CustomField(ResourceModel):
+    """
+    Representa un campo personalizado definido en NoCRM.
+
+    Attributes:
+        name: Nombre del campo
+        type: Tipo de dato del campo (text, number, date, dropdown, ...)
+        resource_type: Recurso al que aplica el campo (lead, client_folder, ...)
+        choices: Opciones disponibles para campos de selección
+        id: ID único del campo en NoCRM
+        created_at: Fecha/hora de creación
+        updated_at: Fecha/hora de última actualización
+    """
+    name: Optional[str] = None
+    type: Optional[str] = None
+    resource_type: Optional[str] = None
+    choices: Optional[List[str]] = None
+    id: Optional[int] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
@@ -0,0 +1,37 @@
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import ClassVar, Optional
+
+from .lead import Lead
+
+
+@dataclass
+class LeadEvent:
+    """
+    Representa un cambio sobre un lead (creación, actualización o eliminación).
+
+    Es el formato común con el que los componentes de notificación (webhooks,
+    change feeds) informan a suscriptores, cachés y mirrors locales.
+
+    Attributes:
+        type: Tipo de cambio (LeadEvent.CREATED, LeadEvent.UPDATED o LeadEvent.DELETED)
+        lead: Lead afectado, con los datos recibidos en el evento
+        source_event: Nombre original del evento en NoCRM (ej: "lead.creation")
+        received_at: Fecha/hora en que se recibió el evento
+
+    Example:
+        >>> event = LeadEvent(type=LeadEvent.UPDATED, lead=lead)
+    """
+    CREATED: ClassVar[str] = "created"
+    UPDATED: ClassVar[str] = "updated"
+    DELETED: ClassVar[str] = "deleted"
+
+    type: str
+    lead: Lead
+    source_event: Optional[str] = None
+    received_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
+    @property
+    def lead_id(self) -> Optional[int]:
+        """ID del lead afectado"""
+        return self.lead.id
@@ -0,0 +1,55 @@
+from dataclasses import dataclass, asdict, fields
+from typing import ClassVar, Dict, Tuple
+from datetime import datetime
+
+
+@dataclass
+class ResourceModel:
+    """
+    Base para los modelos de recursos genéricos de NoCRM (usuarios, equipos, etc.).
+
+    Implementa la misma (de)serialización que `Lead`: convierte fechas ISO a
+    datetime, ignora campos desconocidos y excluye campos None y de solo
+    lectura al serializar.
+
+    Las subclases declaran sus campos y, opcionalmente, redefinen
+    `datetime_fields` y `readonly_fields`.
+    """
+    datetime_fields: ClassVar[Tuple[str, ...]] = ('created_at', 'updated_at')
+    readonly_fields: ClassVar[Tuple[str, ...]] = ('id', 'created_at', 'updated_at')
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'ResourceModel':
+        """
+        Crea una instancia desde un diccionario (deserialización).
+
+        Args:
+            data: Diccionario con datos del recurso (típicamente de respuesta API)
+
+        Returns:
+            Instancia del modelo con los datos deserializados
+        """
+        valid_fields = {f.name for f in fields(cls)}
+        filtered_data = {k: v for k, v in data.items() if k in valid_fields}
+
+        for name in cls.datetime_fields:
+            value = filtered_data.get(name)
+            if isinstance(value, str) and value:
+                filtered_data[name] = datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+        return cls(**filtered_data)
+
+    def to_dict(self) -> Dict:
+        """
+        Convierte la instancia a un diccionario listo para enviar a la API.
+
+        Returns:
+            Dict: Datos del recurso sin campos None ni de solo lectura
+        """
+        data = asdict(self)
+        for name in self.datetime_fields:
+            if isinstance(data.get(name), datetime):
+                data[name] = data[name].isoformat()
+
+        return {k: v for k, v in data.items()
+                if v is not None and k not in self.readonly_fields}
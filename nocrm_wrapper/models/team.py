@@ -0,0 +1,24 @@
+from dataclasses import dataclass
+from typing import Optional, List, Dict
+from datetime import datetime
+
+from .resource import ResourceModel
+
+
+@dataclass
+class Team(ResourceModel):
+    """
+    Representa un equipo de usuarios en NoCRM.
+
+    Attributes:
+        name: Nombre del equipo
+        users: Usuarios que pertenecen al equipo
+        id: ID único del equipo en NoCRM
+        created_at: Fecha/hora de creación
+        updated_at: Fecha/hora de última actualización
+    """
+    name: Optional[str] = None
+    users: Optional[List[Dict]] = None
+    id: Optional[int] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
@@ -0,0 +1,30 @@
+from dataclasses import dataclass
+from typing import Optional
+from datetime import datetime
+
+from .resource import ResourceModel
+
+
+@dataclass
+class User(ResourceModel):
+    """
+    Representa un usuario de la cuenta de NoCRM.
+
+    Attributes:
+        email: Email del usuario
+        firstname: Nombre
+        lastname: Apellido
+        is_admin: Indica si el usuario es administrador
+        phone: Teléfono de contacto
+        id: ID único del usuario en NoCRM
+        created_at: Fecha/hora de creación
+        updated_at: Fecha/hora de última actualización
+    """
+    email: Optional[str] = None
+    firstname: Optional[str] = None
+    lastname: Optional[str] = None
+    is_admin: Optional[bool] = None
+    phone: Optional[str] = None
+    id: Optional[int] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
@@ -1,6 +1,16 @@
+from typing import Dict, Optional
 from .config.config import NoCRMConfig
+from .cache import TTLCache
 from .services.lead_service import LeadService
 from .repositories.lead_repository import LeadRepository
+from .repositories.metrics import RequestMetrics
+from .repositories.rate_limiter import RateLimiter
+from .repositories.concurrency_limiter import AdaptiveConcurrencyLimiter
+from .repositories.resource_repository import ResourceRepository
+from .repositories.resources import RESOURCE_SPECS
+from .repositories.deadline import gather_or_cancel
+from .transport import Transport, AiohttpTransport
+from .webhooks import WebhookReceiver
 
 class NoCRMClient:
     """
@@ -14,22 +24,144 @@ class NoCRMClient:
         config (NoCRMConfig): Configuración de conexión a la API de NoCRM
         repository (LeadRepository): Repositorio de acceso a datos de leads
         leads (LeadService): Servicio de lógica de negocio para leads
+        transport (Transport): Transporte HTTP compartido por todos los repositorios
+        metrics (RequestMetrics): Métricas de las peticiones de todos los repositorios
+        rate_limiter (Optional[RateLimiter]): Límite de tasa compartido (config.rate_limit)
+        concurrency_limiter (Optional[AdaptiveConcurrencyLimiter]): Límite adaptativo de
+            peticiones en vuelo (config.adaptive_concurrency)
+        users, teams, activities, custom_fields (ResourceRepository): Repositorios
+            genéricos, creados de forma perezosa en el primer acceso
     
     Example:
         >>> client = NoCRMClient(api_key="tu_api_key", subdomain="tu_subdominio")
         >>> lead = await client.leads.get_lead(123)
         >>> new_lead = Lead(title="Nueva Oportunidad", status="new")
         >>> created = await client.leads.create_lead(new_lead)
+        >>> users = await client.users.list_all()
     """
     
-    def __init__(self, api_key: str, subdomain: str):
+    def __init__(self,
+                 api_key: str,
+                 subdomain: str,
+                 transport: Optional[Transport] = None,
+                 rate_limiter: Optional[RateLimiter] = None,
+                 **options):
         """
         Inicializa el cliente de NoCRM con las credenciales proporcionadas.
         
         Args:
             api_key: API key de NoCRM (obtener desde configuración de cuenta)
             subdomain: Subdominio de tu cuenta de NoCRM (ej: "mi-empresa" para mi-empresa.nocrm.io)
+            transport: Transporte HTTP compartido por todos los repositorios
+                (por defecto, aiohttp; ver RecordingTransport y ReplayTransport)
+            rate_limiter: Limitador de tasa a compartir (por defecto, uno creado
+                a partir de config.rate_limit)
+            **options: Opciones adicionales de NoCRMConfig (timeout, cache_ttl, etc.)
         """
-        self.config = NoCRMConfig(api_key=api_key, subdomain=subdomain)
-        self.repository = LeadRepository(self.config)
-        self.leads = LeadService(self.repository)
\ No newline at end of file
+        self.config = NoCRMConfig(api_key=api_key, subdomain=subdomain, **options)
+        self.transport = transport or AiohttpTransport(pool_size=self.config.pool_size)
+        self.metrics = RequestMetrics()
+        if rate_limiter is None and self.config.rate_limit:
+            rate_limiter = RateLimiter(self.config.rate_limit)
+        self.rate_limiter = rate_limiter
+        self.concurrency_limiter = None
+        if self.config.adaptive_concurrency:
+            self.concurrency_limiter = AdaptiveConcurrencyLimiter(
+                initial_limit=min(10, self.config.max_concurrency),
+                max_limit=self.config.max_concurrency
+            )
+        cache = None
+        if self.config.cache_ttl:
+            cache = TTLCache(ttl=self.config.cache_ttl, maxsize=self.config.cache_maxsize)
+        self.repository = LeadRepository(self.config, cache=cache, metrics=self.metrics,
+                                         rate_limiter=self.rate_limiter, transport=self.transport,
+                                         concurrency_limiter=self.concurrency_limiter)
+        self.leads = LeadService(self.repository)
+
+    async def warmup(self,
+                     connections: Optional[int] = None,
+                     preload: bool = True,
+                     reference_ttl: float = 300.0) -> Dict:
+        """
+        Prepara el cliente para que las primeras peticiones tengan latencia estable.
+
+        En paralelo: abre conexiones del pool hacia el host del subdominio
+        (DNS + handshake TCP/TLS) y, si `preload` es True, carga pipelines y
+        steps en la caché de referencia (activándola con `reference_ttl` si
+        `config.reference_cache_ttl` no la configuró). Esa carga valida además
+        la API key, por lo que una key inválida falla aquí y no en la primera
+        operación real.
+
+        Args:
+            connections: Conexiones a abrir (por defecto, config.pool_size)
+            preload: Si se precargan pipelines y steps
+            reference_ttl: TTL de la caché de referencia si no estaba activa
+
+        Returns:
+            Dict con las claves `connections`, `pipelines` y `steps` (cantidades)
+
+        Raises:
+            NoCRMAuthenticationError: Si la API key es inválida
+
+        Example:
+            >>> client = NoCRMClient(api_key="...", subdomain="...")
+            >>> await client.warmup()
+        """
+        connections = connections or self.config.pool_size
+        tasks = [self.transport.warmup(self.config.base_url, connections, timeout=self.config.timeout)]
+        if preload:
+            self.repository.enable_reference_cache(reference_ttl)
+            tasks += [self.repository.list_pipelines(), self.repository.list_steps()]
+
+        results = await gather_or_cancel(*tasks)
+        summary = {'connections': results[0], 'pipelines': 0, 'steps': 0}
+        if preload:
+            summary.update(pipelines=len(results[1]), steps=len(results[2]))
+        return summary
+
+    async def close(self) -> None:
+        """Libera las conexiones del transporte y los pools de trabajo del cliente"""
+        await self.repository.close()
+        await self.transport.close()
+
+    async def __aenter__(self) -> 'NoCRMClient':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    def __getattr__(self, name: str) -> ResourceRepository:
+        """
+        Crea bajo demanda el repositorio de un recurso declarado en RESOURCE_SPECS.
+
+        Solo se invoca si el atributo no existe todavía; el repositorio creado
+        se guarda en la instancia para que los siguientes accesos sean directos.
+        """
+        spec = RESOURCE_SPECS.get(name)
+        if spec is None:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        repository = ResourceRepository(self.config, spec, metrics=self.metrics,
+                                        rate_limiter=self.rate_limiter, transport=self.transport,
+                                        concurrency_limiter=self.concurrency_limiter)
+        setattr(self, name, repository)
+        return repository
+
+    def create_webhook_receiver(self, secret: Optional[str] = None, **options) -> WebhookReceiver:
+        """
+        Crea un receptor de webhooks conectado a la caché de leads del cliente.
+
+        Args:
+            secret: Secreto compartido para verificar la firma de los payloads
+            **options: Opciones adicionales de WebhookReceiver (path, signature_header,
+                allow_unsigned)
+
+        Returns:
+            WebhookReceiver: Receptor listo para iniciar con `start()`
+
+        Raises:
+            ValueError: Si no se indica `secret` ni `allow_unsigned=True`
+        """
+        receiver = WebhookReceiver(secret=secret, **options)
+        if self.repository.cache is not None:
+            receiver.attach(self.repository.cache)
+        return receiver
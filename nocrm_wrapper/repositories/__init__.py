@@ -1,4 +1,11 @@
 from .base_repository import BaseRepository
 from .lead_repository import LeadRepository
+from .concurrency_limiter import AdaptiveConcurrencyLimiter
+from .deadline import deadline
+from .metrics import RequestMetrics
+from .rate_limiter import RateLimiter, SharedRateLimiter
+from .resource_repository import ResourceRepository, ResourceSpec
+from .resources import RESOURCE_SPECS
 
-__all__ = ['BaseRepository', 'LeadRepository']
\ No newline at end of file
+__all__ = ['BaseRepository', 'LeadRepository', 'deadline', 'RequestMetrics',
+           'RateLimiter', 'SharedRateLimiter', 'AdaptiveConcurrencyLimiter', 'ResourceRepository', 'ResourceSpec', 'RESOURCE_SPECS']
@@ -1,29 +1,56 @@
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar, List, Optional, Dict
+from typing import Any, Awaitable, Callable, Generic, TypeVar, List, Optional, Dict
+import asyncio
+import json
+import time
 import aiohttp
 from ..config import NoCRMConfig
-from ..exceptions import NoCRMAuthenticationError, NoCRMAPIError
+from ..exceptions import NoCRMAuthenticationError, NoCRMAPIError, NoCRMTimeoutError
+from .deadline import effective_timeout, remaining
+from .metrics import RequestMetrics
+from .rate_limiter import RateLimiter
+from .concurrency_limiter import AdaptiveConcurrencyLimiter, endpoint_key
+from ..transport import Transport, AiohttpTransport
 
 T = TypeVar('T')
 
+# Decodificador asíncrono alternativo para el body de respuestas exitosas
+Decoder = Callable[[bytes], Awaitable[Any]]
+
 
 class BaseRepository(ABC, Generic[T]):
     """Repositorio base abstracto para operaciones CRUD"""
 
-    def __init__(self, config: NoCRMConfig):
+    def __init__(self,
+                 config: NoCRMConfig,
+                 metrics: Optional[RequestMetrics] = None,
+                 rate_limiter: Optional[RateLimiter] = None,
+                 transport: Optional[Transport] = None,
+                 concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None):
         self.config = config
+        self.metrics = metrics
+        self.rate_limiter = rate_limiter
+        self.transport = transport or AiohttpTransport(pool_size=config.pool_size)
+        self._owns_transport = transport is None
+        self.concurrency_limiter = concurrency_limiter
         self.base_url = config.base_url
         self.headers = {
             "X-API-KEY": config.api_key,
             "Content-Type": "application/json"
         }
 
+    async def close(self) -> None:
+        """Cierra el transporte si lo creó el propio repositorio (los compartidos los cierra su dueño)"""
+        if self._owns_transport:
+            await self.transport.close()
+
     async def _make_request(
             self,
             method: str,
             endpoint: str,
             data: Optional[Dict] = None,
-            params: Optional[Dict] = None
+            params: Optional[Dict] = None,
+            decoder: Optional[Decoder] = None
     ) -> Dict:
         """
         Realiza una petición HTTP a la API de NoCRM
@@ -33,41 +60,123 @@ class BaseRepository(ABC, Generic[T]):
             endpoint: Endpoint de la API
             data: Datos para enviar en el body
             params: Parámetros de query string
+            decoder: Decodificador asíncrono para el body de una respuesta
+                exitosa (por defecto, json.loads en el event loop)
 
         Returns:
             Dict con la respuesta de la API
 
         Raises:
             NoCRMAuthenticationError: Error de autenticación
+            NoCRMTimeoutError: Se agotó el timeout o el deadline de la operación
             NoCRMAPIError: Error de la API
         """
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
-
-        async with aiohttp.ClientSession() as session:
+        # Si hay un deadline activo (ver repositories.deadline), el timeout se
+        # reduce al tiempo restante y cubre también la espera del rate limiter
+        timeout = effective_timeout(self.config.timeout)
+        request = self._execute(method, endpoint, url, data, params, timeout, decoder)
+
+        try:
+            if remaining() is None:
+                return await request
+            return await asyncio.wait_for(request, timeout)
+        except asyncio.TimeoutError:
+            raise NoCRMTimeoutError(f"Request to {endpoint} timed out after {timeout:.2f}s")
+
+    async def _execute(
+            self,
+            method: str,
+            endpoint: str,
+            url: str,
+            data: Optional[Dict],
+            params: Optional[Dict],
+            timeout: float,
+            decoder: Optional[Decoder] = None
+    ) -> Dict:
+        """Aplica el rate limit y el límite de concurrencia, envía la petición y registra sus métricas"""
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire()
+        limiter = self.concurrency_limiter
+        if limiter is not None:
+            await limiter.acquire()
+        started = time.perf_counter()
+        failed = True
+        dropped = False
+        cancelled = False
+
+        try:
+            response_data = await self._send(method, url, data, params, timeout=timeout, decoder=decoder)
+            failed = False
+            return response_data
+        except asyncio.TimeoutError:
+            dropped = True
+            raise
+        except NoCRMAPIError as e:
+            dropped = e.status_code == 429
+            raise
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            if limiter is not None:
+                limiter.release(latency=None if cancelled else elapsed, dropped=dropped,
+                                key=endpoint_key(method, endpoint))
+            if self.metrics is not None:
+                self.metrics.record_request(method, endpoint, elapsed, error=failed)
+                if limiter is not None:
+                    self.metrics.set_gauge("concurrency_limit", limiter.limit)
+
+    async def _send(
+            self,
+            method: str,
+            url: str,
+            data: Optional[Dict] = None,
+            params: Optional[Dict] = None,
+            timeout: Optional[float] = None,
+            decoder: Optional[Decoder] = None
+    ) -> Dict:
+        """Ejecuta la petición HTTP a través del transporte y traduce los errores de la API"""
+        try:
+            response = await self.transport.request(
+                method,
+                url,
+                headers=self.headers,
+                json=data,
+                params=params,
+                timeout=timeout or self.config.timeout
+            )
+        except aiohttp.ClientError as e:
+            raise NoCRMAPIError(f"Connection error: {str(e)}")
+
+        if decoder is not None and 200 <= response.status < 300:
             try:
-                async with session.request(
-                        method=method,
-                        url=url,
-                        headers=self.headers,
-                        json=data,
-                        params=params,
-                        timeout=self.config.timeout
-                ) as response:
-                    response_data = await response.json()
-
-                    if response.status == 401:
-                        raise NoCRMAuthenticationError("Invalid API key")
-
-                    if not 200 <= response.status < 300:
-                        raise NoCRMAPIError(
-                            message=response_data.get('message', 'Unknown error'),
-                            status_code=response.status
-                        )
-
-                    return response_data
-
-            except aiohttp.ClientError as e:
-                raise NoCRMAPIError(f"Connection error: {str(e)}")
+                return await decoder(response.body)
+            except (TypeError, ValueError):
+                raise NoCRMAPIError("Invalid JSON response", status_code=response.status)
+
+        try:
+            response_data = self._decode(response.body)
+        except ValueError:
+            raise NoCRMAPIError("Invalid JSON response", status_code=response.status)
+
+        if response.status == 401:
+            raise NoCRMAuthenticationError("Invalid API key")
+
+        if not 200 <= response.status < 300:
+            message = response_data.get('message') if isinstance(response_data, dict) else None
+            raise NoCRMAPIError(
+                message=message or 'Unknown error',
+                status_code=response.status
+            )
+
+        return response_data
+
+    @staticmethod
+    def _decode(body: bytes):
+        """Decodifica el body JSON de una respuesta (None si está vacío)"""
+        return json.loads(body) if body.strip() else None
 
     @abstractmethod
     async def create(self, entity: T) -> T:
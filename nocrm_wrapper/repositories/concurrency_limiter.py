@@ -0,0 +1,135 @@
+import asyncio
+from collections import deque
+from typing import Deque, Dict, Hashable, Optional
+
+
+def endpoint_key(method: str, endpoint: str) -> str:
+    """
+    Clave de ruta para agrupar latencias: método y endpoint con los IDs
+    reemplazados, así `GET leads/1` y `GET leads/2` comparten latencia base
+    pero no con `GET leads`.
+
+    Example:
+        >>> endpoint_key("get", "/leads/123/assign")
+        'GET leads/{id}/assign'
+    """
+    segments = ("{id}" if segment.isdigit() else segment for segment in endpoint.strip('/').split('/'))
+    return f"{method.upper()} {'/'.join(segments)}"
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Limitador de concurrencia adaptativo (AIMD guiado por latencia).
+
+    Controla cuántas peticiones pueden estar en vuelo a la vez y ajusta ese
+    límite según lo observado, al estilo de `AIMDLimit` de Netflix
+    concurrency-limits:
+
+    - Crecimiento aditivo: cada respuesta exitosa con latencia estable suma 1
+      al límite, siempre que el límite actual se esté aprovechando (al menos
+      la mitad en vuelo).
+    - Reducción multiplicativa: un 429, un timeout o una latencia mayor a
+      `tolerance` veces la latencia base multiplican el límite por `backoff_ratio`.
+
+    La latencia base es la mínima observada por ruta (ver `endpoint_key`),
+    así una lectura rápida por ID no convierte en pico a un listado normal; se
+    relaja lentamente hacia las latencias recientes para adaptarse a cambios
+    sostenidos.
+
+    Args:
+        initial_limit: Límite inicial de peticiones en vuelo
+        min_limit: Límite mínimo
+        max_limit: Límite máximo
+        backoff_ratio: Factor de reducción ante congestión (0 < ratio < 1)
+        tolerance: Múltiplo de la latencia base considerado un pico
+        baseline_decay: Peso con que cada muestra relaja la latencia base
+
+    Example:
+        >>> client = NoCRMClient(api_key="...", subdomain="...", adaptive_concurrency=True)
+        >>> client.metrics.snapshot()['gauges']['concurrency_limit']
+    """
+
+    def __init__(self,
+                 initial_limit: int = 10,
+                 min_limit: int = 1,
+                 max_limit: int = 100,
+                 backoff_ratio: float = 0.9,
+                 tolerance: float = 2.0,
+                 baseline_decay: float = 0.01):
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("Limits must satisfy 1 <= min_limit <= initial_limit <= max_limit")
+        if not 0 < backoff_ratio < 1:
+            raise ValueError("Backoff ratio must be between 0 and 1")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff_ratio = backoff_ratio
+        self.tolerance = tolerance
+        self.baseline_decay = baseline_decay
+        self._limit = float(initial_limit)
+        self.in_flight = 0
+        self.baselines: Dict[Hashable, float] = {}
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    @property
+    def limit(self) -> int:
+        """Límite actual de peticiones en vuelo"""
+        return int(self._limit)
+
+    async def acquire(self) -> None:
+        """Espera hasta que haya lugar dentro del límite y reserva un slot"""
+        while self.in_flight >= self.limit:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                elif waiter.done() and not waiter.cancelled():
+                    # Nos despertaron justo al cancelarnos: cedemos el turno
+                    self._wake()
+                raise
+        self.in_flight += 1
+
+    def release(self, latency: Optional[float] = None, dropped: bool = False, key: Hashable = None) -> None:
+        """
+        Libera un slot y ajusta el límite con el resultado de la petición.
+
+        Args:
+            latency: Latencia observada en segundos (None = no ajustar, p. ej.
+                si la petición fue cancelada)
+            dropped: True si la petición terminó en 429 o timeout
+            key: Ruta de la petición, cuya latencia base se compara con `latency`
+        """
+        if dropped:
+            self._decrease()
+        elif latency is not None:
+            self._on_sample(key, latency, self.in_flight)
+
+        self.in_flight -= 1
+        self._wake()
+
+    def _wake(self) -> None:
+        """Despierta tantos waiters como slots libres haya"""
+        free = self.limit - self.in_flight
+        while free > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                free -= 1
+
+    def _on_sample(self, key: Hashable, latency: float, in_flight: int) -> None:
+        baseline = self.baselines.get(key)
+        if baseline is None or latency < baseline:
+            baseline = latency
+        else:
+            baseline += (latency - baseline) * self.baseline_decay
+        self.baselines[key] = baseline
+
+        if latency > baseline * self.tolerance:
+            self._decrease()
+        elif in_flight * 2 >= self._limit:
+            self._limit = min(float(self.max_limit), self._limit + 1)
+
+    def _decrease(self) -> None:
+        self._limit = max(float(self.min_limit), self._limit * self.backoff_ratio)
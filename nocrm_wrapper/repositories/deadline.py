@@ -0,0 +1,98 @@
+import asyncio
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Awaitable, Iterator, List, Optional
+
+from ..exceptions import NoCRMTimeoutError
+
+# Instante límite (time.monotonic) de la operación en curso, si hay uno
+_deadline: ContextVar[Optional[float]] = ContextVar("nocrm_deadline", default=None)
+
+
+@contextmanager
+def deadline(seconds: Optional[float]) -> Iterator[None]:
+    """
+    Establece un presupuesto de tiempo para todas las peticiones del bloque.
+
+    Se propaga a cada `_make_request` ejecutado dentro del bloque, incluidas
+    las tareas creadas desde él, que reducen su timeout al tiempo restante.
+    Los bloques anidados nunca extienden el presupuesto exterior. Con
+    `seconds=None` no se aplica ningún límite adicional.
+
+    Args:
+        seconds: Segundos disponibles para todo el bloque
+
+    Example:
+        >>> with deadline(2.0):
+        ...     await client.leads.process_lead(123, user_id=456, step_name="Won")
+    """
+    if seconds is None:
+        yield
+        return
+    limit = time.monotonic() + seconds
+    current = _deadline.get()
+    if current is not None:
+        limit = min(limit, current)
+    token = _deadline.set(limit)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining() -> Optional[float]:
+    """
+    Segundos restantes del presupuesto activo.
+
+    Returns:
+        Optional[float]: Tiempo restante (puede ser <= 0) o None si no hay presupuesto
+    """
+    limit = _deadline.get()
+    return None if limit is None else limit - time.monotonic()
+
+
+def effective_timeout(default: float) -> float:
+    """
+    Timeout a usar en la próxima petición: el menor entre `default` y el tiempo restante.
+
+    Raises:
+        NoCRMTimeoutError: Si el presupuesto ya se agotó
+    """
+    left = remaining()
+    if left is None:
+        return default
+    if left <= 0:
+        raise NoCRMTimeoutError("Deadline exceeded before sending the request")
+    return min(default, left)
+
+
+async def gather_or_cancel(*aws: Awaitable[Any]) -> List[Any]:
+    """
+    Ejecuta varias operaciones concurrentemente y cancela las restantes ante el primer error.
+
+    A diferencia de `asyncio.gather`, cuando una rama falla (o se agota el
+    presupuesto) las peticiones hermanas en vuelo se cancelan en lugar de
+    seguir consumiendo conexiones y cuota de la API.
+
+    Args:
+        *aws: Corrutinas o awaitables a ejecutar
+
+    Returns:
+        List: Resultados en el mismo orden que `aws`
+
+    Raises:
+        La primera excepción producida por cualquiera de las ramas
+    """
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        for task in done:
+            if task.exception() is not None:
+                raise task.exception()
+        return [task.result() for task in tasks]
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -1,16 +1,41 @@
 from typing import List, Optional, Dict
 from ..models import Lead
 from ..config import NoCRMConfig
+from ..cache import TTLCache
 from ..exceptions import NoCRMAPIError
 from .base_repository import BaseRepository
+from .metrics import RequestMetrics
+from .rate_limiter import RateLimiter
+from .offload import DecodeOffloader
+from ..transport import Transport
+from .concurrency_limiter import AdaptiveConcurrencyLimiter
 
 
 class LeadRepository(BaseRepository[Lead]):
     """Repositorio para operaciones CRUD de Leads en NoCRM"""
 
-    def __init__(self, config: NoCRMConfig):
-        super().__init__(config)
+    def __init__(self,
+                 config: NoCRMConfig,
+                 cache: Optional[TTLCache] = None,
+                 metrics: Optional[RequestMetrics] = None,
+                 rate_limiter: Optional[RateLimiter] = None,
+                 transport: Optional[Transport] = None,
+                 concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None):
+        super().__init__(config, metrics, rate_limiter, transport, concurrency_limiter)
         self.endpoint = "leads"
+        self.cache = cache
+        self.reference_cache = None
+        if config.reference_cache_ttl is not None:
+            self.enable_reference_cache(config.reference_cache_ttl)
+        self.offloader = None
+        if config.offload_threshold is not None:
+            self.offloader = DecodeOffloader(config.offload_threshold, max_workers=config.offload_workers)
+
+    def _remember(self, lead: Lead) -> Lead:
+        """Guarda el lead en la caché (si está habilitada) y lo devuelve"""
+        if self.cache is not None and lead.id is not None:
+            self.cache.set(lead.id, lead)
+        return lead
 
     async def create(self, lead: Lead) -> Lead:
         """
@@ -27,12 +52,15 @@ class LeadRepository(BaseRepository[Lead]):
         """
         data = lead.to_dict()
         response = await self._make_request("POST", self.endpoint, data=data)
-        return Lead.from_dict(response)
+        return self._remember(Lead.from_dict(response))
 
     async def get(self, id: int) -> Optional[Lead]:
         """
         Obtiene un lead por su ID
 
+        Si la caché está habilitada y contiene el lead, se devuelve sin
+        realizar ninguna petición a la API.
+
         Args:
             id: ID del lead a obtener
 
@@ -42,9 +70,13 @@ class LeadRepository(BaseRepository[Lead]):
         Raises:
             NoCRMAPIError: Si hay un error en la petición
         """
+        if self.cache is not None:
+            cached = self.cache.get(id)
+            if cached is not None:
+                return cached
         try:
             response = await self._make_request("GET", f"{self.endpoint}/{id}")
-            return Lead.from_dict(response)
+            return self._remember(Lead.from_dict(response))
         except NoCRMAPIError as e:
             if e.status_code == 404:
                 return None
@@ -71,7 +103,7 @@ class LeadRepository(BaseRepository[Lead]):
             data.pop(field, None)
 
         response = await self._make_request("PUT", f"{self.endpoint}/{id}", data=data)
-        return Lead.from_dict(response)
+        return self._remember(Lead.from_dict(response))
 
     async def delete(self, id: int) -> bool:
         """
@@ -86,6 +118,8 @@ class LeadRepository(BaseRepository[Lead]):
         Raises:
             NoCRMAPIError: Si hay un error en la eliminación
         """
+        if self.cache is not None:
+            self.cache.invalidate(id)
         try:
             await self._make_request("DELETE", f"{self.endpoint}/{id}")
             return True
@@ -98,6 +132,9 @@ class LeadRepository(BaseRepository[Lead]):
         """
         Lista todos los leads con filtros opcionales
 
+        Si `config.offload_threshold` está configurado, las respuestas grandes
+        se decodifican fuera del event loop (ver DecodeOffloader).
+
         Args:
             **filters: Filtros para la búsqueda (status, page, per_page, etc.)
 
@@ -107,27 +144,61 @@ class LeadRepository(BaseRepository[Lead]):
         Raises:
             NoCRMAPIError: Si hay un error en la petición
         """
+        if self.offloader is not None:
+            return await self._make_request("GET", self.endpoint, params=filters,
+                                            decoder=self.offloader.decode_leads)
         response = await self._make_request("GET", self.endpoint, params=filters)
         return [Lead.from_dict(lead_data) for lead_data in response]
 
+    async def close(self) -> None:
+        """Libera los recursos propios del repositorio (pool de decodificación y transporte propio)"""
+        if self.offloader is not None:
+            self.offloader.shutdown()
+        await super().close()
+
+    def enable_reference_cache(self, ttl: float) -> None:
+        """
+        Activa la caché de pipelines y steps (no hace nada si ya está activa).
+
+        Args:
+            ttl: Segundos que los datos de referencia permanecen en caché
+        """
+        if self.reference_cache is None:
+            self.reference_cache = TTLCache(ttl=ttl)
+
     async def list_pipelines(self) -> List[dict]:
         """
         Obtiene la lista de pipelines disponibles
 
+        Si la caché de referencia está activa (`config.reference_cache_ttl` o
+        `enable_reference_cache`), el resultado se guarda en ella.
+
         Returns:
             List[dict]: Lista de pipelines
         """
-        response = await self._make_request("GET", "pipelines")
-        return response
+        return await self._reference("pipelines")
 
     async def list_steps(self) -> List[dict]:
         """
         Obtiene la lista de estados disponibles
 
+        Si la caché de referencia está activa (`config.reference_cache_ttl` o
+        `enable_reference_cache`), el resultado se guarda en ella.
+
         Returns:
             List[dict]: Lista de estados (steps) disponibles
         """
-        response = await self._make_request("GET", "steps")
+        return await self._reference("steps")
+
+    async def _reference(self, endpoint: str) -> List[dict]:
+        """Obtiene datos de referencia (pipelines, steps) usando la caché si está habilitada"""
+        if self.reference_cache is not None:
+            cached = self.reference_cache.get(endpoint)
+            if cached is not None:
+                return list(cached)
+        response = await self._make_request("GET", endpoint)
+        if self.reference_cache is not None:
+            self.reference_cache.set(endpoint, list(response))
         return response
 
     async def assign_lead(self, id: int, user_id: int) -> Lead:
@@ -146,7 +217,7 @@ class LeadRepository(BaseRepository[Lead]):
             f"leads/{id}/assign",
             data={"user_id": user_id}
         )
-        return Lead.from_dict(response)
+        return self._remember(Lead.from_dict(response))
 
     async def change_status(self, id: int, step_id_or_name: str) -> Lead:
         """
@@ -164,4 +235,4 @@ class LeadRepository(BaseRepository[Lead]):
             f"leads/{id}",
             data={"step": step_id_or_name}
         )
-        return Lead.from_dict(response)
\ No newline at end of file
+        return self._remember(Lead.from_dict(response))
\ No newline at end of file
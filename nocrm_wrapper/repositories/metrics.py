@@ -0,0 +1,102 @@
+from dataclasses import dataclass, field
+from typing import Dict, Tuple
+
+
+@dataclass
+class EndpointStats:
+    """Estadísticas acumuladas de las peticiones a un endpoint"""
+    count: int = 0
+    errors: int = 0
+    total_time: float = 0.0
+    max_time: float = 0.0
+
+    @property
+    def avg_time(self) -> float:
+        """Latencia media en segundos"""
+        return self.total_time / self.count if self.count else 0.0
+
+
+@dataclass
+class CacheStats:
+    """Aciertos y fallos de caché de un recurso"""
+    hits: int = 0
+    misses: int = 0
+
+
+@dataclass
+class RequestMetrics:
+    """
+    Instrumentación en memoria de las peticiones realizadas por los repositorios.
+
+    Los repositorios registran cada petición (método + recurso) con su latencia
+    y si terminó en error, los aciertos/fallos de caché y métricas
+    instantáneas (gauges) como el límite de concurrencia adaptativo.
+
+    Example:
+        >>> metrics = RequestMetrics()
+        >>> client = NoCRMClient(api_key="...", subdomain="...")
+        >>> await client.users.list()
+        >>> client.metrics.snapshot()
+    """
+    requests: Dict[Tuple[str, str], EndpointStats] = field(default_factory=dict)
+    cache: Dict[str, CacheStats] = field(default_factory=dict)
+    gauges: Dict[str, float] = field(default_factory=dict)
+
+    def record_request(self, method: str, endpoint: str, duration: float, error: bool = False) -> None:
+        """
+        Registra una petición HTTP.
+
+        Args:
+            method: Método HTTP
+            endpoint: Endpoint solicitado (se agrupa por el primer segmento)
+            duration: Duración en segundos
+            error: True si la petición terminó en error
+        """
+        resource = endpoint.strip('/').split('/')[0]
+        stats = self.requests.setdefault((method.upper(), resource), EndpointStats())
+        stats.count += 1
+        stats.errors += int(error)
+        stats.total_time += duration
+        stats.max_time = max(stats.max_time, duration)
+
+    def record_cache(self, resource: str, hit: bool) -> None:
+        """Registra un acierto (hit=True) o fallo de caché para un recurso"""
+        stats = self.cache.setdefault(resource, CacheStats())
+        if hit:
+            stats.hits += 1
+        else:
+            stats.misses += 1
+
+    def set_gauge(self, name: str, value: float) -> None:
+        """Registra el valor actual de una métrica instantánea (p. ej. el límite de concurrencia)"""
+        self.gauges[name] = value
+
+    def snapshot(self) -> Dict:
+        """
+        Devuelve una copia serializable de las métricas actuales.
+
+        Returns:
+            Dict con las claves `requests`, `cache` y `gauges`
+        """
+        return {
+            'requests': {
+                f"{method} {resource}": {
+                    'count': s.count,
+                    'errors': s.errors,
+                    'avg_time': s.avg_time,
+                    'max_time': s.max_time,
+                }
+                for (method, resource), s in self.requests.items()
+            },
+            'cache': {
+                resource: {'hits': s.hits, 'misses': s.misses}
+                for resource, s in self.cache.items()
+            },
+            'gauges': dict(self.gauges),
+        }
+
+    def reset(self) -> None:
+        """Reinicia todas las métricas"""
+        self.requests.clear()
+        self.cache.clear()
+        self.gauges.clear()
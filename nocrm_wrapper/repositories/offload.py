@@ -0,0 +1,94 @@
+import asyncio
+import json
+import sys
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import astuple, fields
+from typing import List, Optional, Tuple
+
+from ..models import Lead
+
+_LEAD_FIELDS = tuple(f.name for f in fields(Lead))
+
+
+def _gil_disabled() -> bool:
+    """True si el intérprete corre sin GIL (builds free-threaded de Python 3.13+)"""
+    is_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_enabled is not None and not is_enabled()
+
+
+def decode_lead_rows(body: bytes) -> List[Tuple]:
+    """
+    Decodifica un listado JSON de leads y construye cada Lead.
+
+    Se ejecuta en el proceso/hilo de trabajo. Devuelve los valores de cada lead
+    como tuplas en el orden de los campos del modelo, que se serializan de
+    forma mucho más compacta que las instancias completas.
+
+    Args:
+        body: Body crudo de la respuesta
+
+    Returns:
+        List[Tuple]: Una tupla de valores de campos por lead
+    """
+    return [astuple(Lead.from_dict(item)) for item in json.loads(body)]
+
+
+class DecodeOffloader:
+    """
+    Descarga la decodificación de listados grandes de leads fuera del event loop.
+
+    Las respuestas con un body de al menos `threshold` bytes se decodifican
+    (JSON + `Lead.from_dict`) en un pool de procesos, o de hilos si el
+    intérprete no tiene GIL; las más chicas se procesan en línea porque el
+    costo de enviarlas al pool supera al de decodificarlas.
+
+    Args:
+        threshold: Tamaño mínimo del body, en bytes, para descargar el trabajo
+        max_workers: Cantidad de workers del pool (por defecto, la del executor)
+        executor: Executor a usar en lugar de crear uno propio
+
+    Example:
+        >>> offloader = DecodeOffloader(threshold=256 * 1024)
+        >>> leads = await repository._make_request("GET", "leads", decoder=offloader.decode_leads)
+    """
+
+    def __init__(self,
+                 threshold: int = 256 * 1024,
+                 max_workers: Optional[int] = None,
+                 executor: Optional[Executor] = None):
+        if threshold < 0:
+            raise ValueError("Offload threshold cannot be negative")
+        self.threshold = threshold
+        self.max_workers = max_workers
+        self._executor = executor
+        self._owns_executor = executor is None
+
+    @property
+    def executor(self) -> Executor:
+        """Executor del pool, creado la primera vez que se necesita"""
+        if self._executor is None:
+            pool = ThreadPoolExecutor if _gil_disabled() else ProcessPoolExecutor
+            self._executor = pool(max_workers=self.max_workers)
+        return self._executor
+
+    async def decode_leads(self, body: bytes) -> List[Lead]:
+        """
+        Decodifica un listado de leads, en línea o en el pool según su tamaño.
+
+        Args:
+            body: Body crudo de la respuesta
+
+        Returns:
+            List[Lead]: Leads del listado
+        """
+        if len(body) < self.threshold:
+            return [Lead.from_dict(item) for item in json.loads(body)]
+        loop = asyncio.get_running_loop()
+        rows = await loop.run_in_executor(self.executor, decode_lead_rows, body)
+        return [Lead(*row) for row in rows]
+
+    def shutdown(self) -> None:
+        """Detiene el pool si fue creado por esta instancia"""
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
@@ -0,0 +1,90 @@
+import asyncio
+import time
+from typing import Callable, Optional
+
+
+class RateLimiter:
+    """
+    Limitador de tasa tipo token bucket para las peticiones a la API.
+
+    Permite ráfagas de hasta `burst` peticiones y luego una tasa sostenida de
+    `rate` peticiones por segundo. Se comparte entre todos los repositorios de
+    un cliente para respetar el límite global de la cuenta.
+
+    Args:
+        rate: Peticiones por segundo permitidas
+        burst: Tamaño máximo de ráfaga (por defecto, max(1, rate))
+        clock: Función que devuelve el tiempo actual en segundos
+
+    Example:
+        >>> limiter = RateLimiter(rate=5)
+        >>> await limiter.acquire()
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        if rate <= 0:
+            raise ValueError("Rate limit must be positive")
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate)
+        self._clock = clock
+        self._tokens = self.burst
+        self._updated = clock()
+        self._lock: Optional[asyncio.Lock] = None
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        """Espera hasta que haya un token disponible y lo consume"""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            self._refill()
+            while self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+
+
+class SharedRateLimiter:
+    """
+    Token bucket compartido entre procesos (misma interfaz que RateLimiter).
+
+    El estado vive en memoria compartida de `multiprocessing`, así que varios
+    procesos de trabajo, cada uno con su propio event loop, consumen del mismo
+    presupuesto global de peticiones por segundo. Debe crearse en el proceso
+    padre y pasarse a los procesos hijos al crearlos.
+
+    Args:
+        rate: Peticiones por segundo permitidas en total
+        burst: Tamaño máximo de ráfaga (por defecto, max(1, rate))
+        context: Contexto de multiprocessing a usar (por defecto, el del sistema)
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None, context=None):
+        import multiprocessing
+
+        if rate <= 0:
+            raise ValueError("Rate limit must be positive")
+        context = context or multiprocessing.get_context()
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate)
+        self._lock = context.Lock()
+        self._tokens = context.RawValue('d', self.burst)
+        self._updated = context.RawValue('d', time.time())
+
+    async def acquire(self) -> None:
+        """Espera hasta que haya un token disponible en el presupuesto global y lo consume"""
+        while True:
+            with self._lock:
+                now = time.time()
+                tokens = min(self.burst, self._tokens.value + (now - self._updated.value) * self.rate)
+                self._updated.value = now
+                if tokens >= 1:
+                    self._tokens.value = tokens - 1
+                    return
+                self._tokens.value = tokens
+            await asyncio.sleep((1 - tokens) / self.rate)
@@ -0,0 +1,295 @@
+import asyncio
+import copy
+import json
+from dataclasses import dataclass
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Type, TypeVar
+
+from ..cache import TTLCache
+from ..config import NoCRMConfig
+from ..exceptions import NoCRMAPIError
+from ..models.resource import ResourceModel
+from .base_repository import BaseRepository
+from .metrics import RequestMetrics
+from .rate_limiter import RateLimiter
+from ..transport import Transport
+from .concurrency_limiter import AdaptiveConcurrencyLimiter
+
+R = TypeVar('R', bound=ResourceModel)
+
+PAGINATION_OFFSET = "offset"
+PAGINATION_PAGE = "page"
+PAGINATION_NONE = "none"
+
+
+@dataclass(frozen=True)
+class ResourceSpec:
+    """
+    Descripción declarativa de un recurso de la API de NoCRM.
+
+    Attributes:
+        name: Nombre del recurso (también nombre del atributo en NoCRMClient)
+        endpoint: Endpoint de la API (ej: "users")
+        model: Clase del modelo (subclase de ResourceModel)
+        id_field: Campo que identifica a cada entidad
+        pagination: Estilo de paginación: "offset" (limit/offset),
+            "page" (page/per_page) o "none"
+        page_size: Cantidad de elementos por página
+        cacheable: Si las lecturas pueden guardarse en caché (la caché se activa
+            con `config.cache_ttl`, igual que la de leads)
+        cache_ttl: Segundos de validez de las entradas en caché (por defecto,
+            `config.cache_ttl`)
+    """
+    name: str
+    endpoint: str
+    model: Type[ResourceModel]
+    id_field: str = "id"
+    pagination: str = PAGINATION_OFFSET
+    page_size: int = 100
+    cacheable: bool = False
+    cache_ttl: Optional[float] = None
+
+    def __post_init__(self):
+        if self.pagination not in (PAGINATION_OFFSET, PAGINATION_PAGE, PAGINATION_NONE):
+            raise ValueError(f"Invalid pagination style: {self.pagination}")
+        if self.page_size <= 0:
+            raise ValueError("Page size must be positive")
+
+
+class ResourceRepository(BaseRepository[R]):
+    """
+    Repositorio genérico para recursos de NoCRM descritos por un ResourceSpec.
+
+    Provee CRUD, paginación, caché, lecturas en lote e instrumentación de forma
+    uniforme para cualquier recurso, sin tener que escribir un repositorio por
+    cada uno.
+
+    La caché (opcional, acotada por `config.cache_maxsize`) guarda y entrega
+    copias de las entidades, así que modificar una entidad devuelta no altera
+    las lecturas siguientes.
+
+    Example:
+        >>> users = ResourceRepository(config, USERS)
+        >>> async for page in users.iter_pages():
+        ...     print(len(page))
+        >>> some_users = await users.get_many([1, 2, 3])
+    """
+
+    def __init__(self,
+                 config: NoCRMConfig,
+                 spec: ResourceSpec,
+                 metrics: Optional[RequestMetrics] = None,
+                 rate_limiter: Optional[RateLimiter] = None,
+                 transport: Optional[Transport] = None,
+                 concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None):
+        super().__init__(config, metrics, rate_limiter, transport, concurrency_limiter)
+        self.spec = spec
+        self.endpoint = spec.endpoint
+        self.cache = None
+        if spec.cacheable and config.cache_ttl:
+            self.cache = TTLCache(ttl=spec.cache_ttl or config.cache_ttl, maxsize=config.cache_maxsize)
+
+    def _build(self, data: Dict) -> R:
+        return self.spec.model.from_dict(data)
+
+    def _id_of(self, entity: R):
+        return getattr(entity, self.spec.id_field, None)
+
+    def _cache_get(self, key):
+        if self.cache is None:
+            return None
+        value = self.cache.get(key)
+        if self.metrics is not None:
+            self.metrics.record_cache(self.spec.name, hit=value is not None)
+        return self._copy(value)
+
+    def _cache_set(self, key, value) -> None:
+        if self.cache is not None:
+            self.cache.set(key, self._copy(value))
+
+    @staticmethod
+    def _copy(value):
+        # Copias superficiales: los llamadores no comparten instancias con la caché
+        if isinstance(value, list):
+            return [copy.copy(entity) for entity in value]
+        return copy.copy(value)
+
+    def _after_write(self, entity: Optional[R] = None) -> None:
+        # Cualquier escritura invalida los listados cacheados
+        if self.cache is not None:
+            self.cache.clear()
+            if entity is not None and self._id_of(entity) is not None:
+                self._cache_set(self._id_of(entity), entity)
+
+    def invalidate(self, id=None) -> None:
+        """
+        Invalida la caché del recurso.
+
+        Args:
+            id: ID a invalidar; si es None se vacía toda la caché
+        """
+        if self.cache is None:
+            return
+        if id is None:
+            self.cache.clear()
+        else:
+            self.cache.invalidate(id)
+
+    async def create(self, entity: R) -> R:
+        """
+        Crea una nueva entidad
+
+        Args:
+            entity: Entidad a crear
+
+        Returns:
+            Entidad creada con ID y timestamps
+        """
+        response = await self._make_request("POST", self.endpoint, data=entity.to_dict())
+        created = self._build(response)
+        self._after_write(created)
+        return created
+
+    async def get(self, id) -> Optional[R]:
+        """
+        Obtiene una entidad por su ID (usando la caché si está habilitada)
+
+        Args:
+            id: ID de la entidad
+
+        Returns:
+            Entidad encontrada o None si no existe
+        """
+        cached = self._cache_get(id)
+        if cached is not None:
+            return cached
+        try:
+            response = await self._make_request("GET", f"{self.endpoint}/{id}")
+        except NoCRMAPIError as e:
+            if e.status_code == 404:
+                return None
+            raise
+        entity = self._build(response)
+        self._cache_set(id, entity)
+        return entity
+
+    async def get_many(self, ids: Iterable, concurrency: int = 5) -> List[Optional[R]]:
+        """
+        Obtiene varias entidades en lote con concurrencia acotada.
+
+        Los IDs presentes en caché no generan peticiones.
+
+        Args:
+            ids: IDs a obtener
+            concurrency: Máximo de peticiones simultáneas
+
+        Returns:
+            Lista de entidades (None para las inexistentes) en el orden de `ids`
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(id):
+            async with semaphore:
+                return await self.get(id)
+
+        return list(await asyncio.gather(*(fetch(id) for id in ids)))
+
+    async def update(self, id, entity: R) -> R:
+        """
+        Actualiza una entidad existente
+
+        Args:
+            id: ID de la entidad
+            entity: Entidad con los datos actualizados
+
+        Returns:
+            Entidad actualizada
+        """
+        response = await self._make_request("PUT", f"{self.endpoint}/{id}", data=entity.to_dict())
+        updated = self._build(response)
+        self._after_write(updated)
+        return updated
+
+    async def delete(self, id) -> bool:
+        """
+        Elimina una entidad
+
+        Args:
+            id: ID de la entidad
+
+        Returns:
+            bool: True si se eliminó, False si no existía
+        """
+        try:
+            await self._make_request("DELETE", f"{self.endpoint}/{id}")
+            return True
+        except NoCRMAPIError as e:
+            if e.status_code == 404:
+                return False
+            raise
+        finally:
+            self._after_write()
+
+    def _page_params(self, index: int, filters: Dict) -> Dict:
+        params = dict(filters)
+        if self.spec.pagination == PAGINATION_OFFSET:
+            params.update(limit=self.spec.page_size, offset=index * self.spec.page_size)
+        elif self.spec.pagination == PAGINATION_PAGE:
+            params.update(page=index + 1, per_page=self.spec.page_size)
+        return params
+
+    async def list(self, **filters) -> List[R]:
+        """
+        Lista las entidades de una petición (sin recorrer páginas)
+
+        Args:
+            **filters: Filtros y parámetros de paginación explícitos
+
+        Returns:
+            Lista de entidades
+        """
+        key = ("list", json.dumps(filters, sort_keys=True, default=str))
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        response = await self._make_request("GET", self.endpoint, params=filters or None)
+        entities = [self._build(item) for item in response]
+        self._cache_set(key, entities)
+        return entities
+
+    async def iter_pages(self, **filters) -> AsyncIterator[List[R]]:
+        """
+        Recorre todas las páginas del listado según el estilo de paginación.
+
+        Args:
+            **filters: Filtros de la búsqueda
+
+        Yields:
+            Lista de entidades de cada página
+        """
+        if self.spec.pagination == PAGINATION_NONE:
+            yield await self.list(**filters)
+            return
+
+        index = 0
+        while True:
+            page = await self.list(**self._page_params(index, filters))
+            if page:
+                yield page
+            if len(page) < self.spec.page_size:
+                return
+            index += 1
+
+    async def list_all(self, **filters) -> List[R]:
+        """
+        Devuelve todas las entidades recorriendo todas las páginas
+
+        Args:
+            **filters: Filtros de la búsqueda
+
+        Returns:
+            Lista completa de entidades
+        """
+        entities: List[R] = []
+        async for page in self.iter_pages(**filters):
+            entities.extend(page)
+        return entities
@@ -0,0 +1,17 @@
+from typing import Dict
+
+from ..models import User, Team, Activity, CustomField
+from .resource_repository import ResourceSpec, PAGINATION_NONE
+
+USERS = ResourceSpec(name="users", endpoint="users", model=User, cacheable=True)
+TEAMS = ResourceSpec(name="teams", endpoint="teams", model=Team,
+                     pagination=PAGINATION_NONE, cacheable=True)
+ACTIVITIES = ResourceSpec(name="activities", endpoint="activities", model=Activity,
+                          pagination=PAGINATION_NONE, cacheable=True)
+CUSTOM_FIELDS = ResourceSpec(name="custom_fields", endpoint="fields", model=CustomField,
+                             pagination=PAGINATION_NONE, cacheable=True)
+
+# Recursos expuestos como atributos perezosos de NoCRMClient
+RESOURCE_SPECS: Dict[str, ResourceSpec] = {
+    spec.name: spec for spec in (USERS, TEAMS, ACTIVITIES, CUSTOM_FIELDS)
+}
@@ -0,0 +1,197 @@
+# src/services/change_feed.py
+import asyncio
+import json
+import os
+from datetime import datetime, timezone
+from typing import AsyncIterator, Awaitable, Callable, List, Optional, Set, Tuple
+
+from ..models.lead import Lead
+from ..models.lead_event import LeadEvent
+from ..repositories.lead_repository import LeadRepository
+
+_Key = Tuple[int, str]
+
+
+class FileCursorStore:
+    """
+    Persiste el cursor de un change feed en un archivo JSON.
+
+    La escritura es atómica (archivo temporal + reemplazo) para que una
+    interrupción nunca deje un cursor corrupto.
+
+    Args:
+        path: Ruta del archivo del cursor
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def load(self) -> Optional[dict]:
+        """Devuelve el cursor guardado o None si no existe"""
+        if not os.path.exists(self.path):
+            return None
+        with open(self.path, encoding="utf-8") as f:
+            return json.load(f)
+
+    def save(self, cursor: dict) -> None:
+        """Guarda el cursor"""
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(cursor, f)
+        os.replace(tmp_path, self.path)
+
+
+def _utc(value: datetime) -> datetime:
+    """Convierte a UTC; las fechas sin zona horaria se interpretan como hora local"""
+    return value.astimezone(timezone.utc)
+
+
+def _parse(value: str) -> datetime:
+    return _utc(datetime.fromisoformat(value.replace('Z', '+00:00')))
+
+
+class LeadChangeFeed:
+    """
+    Change feed de leads basado en polling con watermark de `updated_at`.
+
+    En cada ciclo pide los leads actualizados después del watermark (ordenados
+    por última actualización, paginando por keyset sobre `updated_at` para no
+    saltear filas si los datos cambian entre páginas) y emite un
+    LeadEvent por cada cambio nuevo. Los eventos se deduplican por
+    (id, updated_at), así que los leads en el borde del watermark no se repiten.
+
+    El intervalo de polling es adaptativo: se multiplica por `backoff` en cada
+    ciclo sin cambios (hasta `max_interval`) y vuelve a `min_interval` apenas
+    aparece actividad. Si hay `cursor_store`, el cursor se persiste cuando el
+    consumidor pide el evento siguiente (es decir, después de procesar el
+    actual), por lo que un reinicio continúa donde quedó: los eventos ya
+    procesados no se repiten y solo el que estaba en curso al interrumpirse se
+    vuelve a entregar.
+
+    Args:
+        repository: Repositorio de leads
+        cursor_store: Almacenamiento del cursor (None = solo en memoria)
+        since: Instante desde el que observar cambios si no hay cursor guardado
+            (por defecto, ahora); si no tiene zona horaria se toma como hora local
+        min_interval: Intervalo mínimo entre consultas, en segundos
+        max_interval: Intervalo máximo entre consultas, en segundos
+        backoff: Factor de crecimiento del intervalo sin actividad
+        page_size: Leads por página en cada consulta
+        sleep: Función de espera (inyectable para tests)
+    """
+
+    def __init__(self,
+                 repository: LeadRepository,
+                 cursor_store: Optional[FileCursorStore] = None,
+                 since: Optional[datetime] = None,
+                 min_interval: float = 5.0,
+                 max_interval: float = 300.0,
+                 backoff: float = 2.0,
+                 page_size: int = 100,
+                 sleep: Callable[[float], Awaitable[None]] = asyncio.sleep):
+        if not 0 < min_interval <= max_interval:
+            raise ValueError("Intervals must satisfy 0 < min_interval <= max_interval")
+        if backoff < 1:
+            raise ValueError("Backoff factor must be >= 1")
+        self.repository = repository
+        self.cursor_store = cursor_store
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.page_size = page_size
+        self.interval = min_interval
+        self._sleep = sleep
+
+        cursor = cursor_store.load() if cursor_store else None
+        if cursor:
+            self.watermark = _parse(cursor['watermark'])
+            self._seen: Set[_Key] = {(id, updated_at) for id, updated_at in cursor.get('seen', [])}
+        else:
+            self.watermark = _utc(since) if since else datetime.now(timezone.utc)
+            self._seen = set()
+
+    def cursor(self) -> dict:
+        """Estado serializable del feed (watermark y claves ya emitidas en el borde)"""
+        return {
+            'watermark': self.watermark.isoformat(),
+            'seen': sorted([id, updated_at] for id, updated_at in self._seen),
+        }
+
+    async def poll(self) -> List[LeadEvent]:
+        """
+        Ejecuta un ciclo de consulta sin avanzar el cursor.
+
+        Returns:
+            List[LeadEvent]: Cambios nuevos, ordenados por `updated_at`
+        """
+        events: List[LeadEvent] = []
+        fetched: Set[_Key] = set()
+        cursor = self.watermark
+        offset = 0
+        while True:
+            # Paginación por keyset: cada página se pide desde el último
+            # updated_at visto, así un lead que se actualiza a mitad del ciclo
+            # no desplaza filas que todavía no se leyeron
+            page = await self.repository.list(
+                updated_after=cursor.isoformat(),
+                order="last_update",
+                direction="asc",
+                limit=self.page_size,
+                offset=offset
+            )
+            new_rows = 0
+            for lead in page:
+                if lead.id is None or lead.updated_at is None:
+                    continue
+                key = (lead.id, lead.updated_at.isoformat())
+                if key in fetched:
+                    continue
+                fetched.add(key)
+                new_rows += 1
+                event = self._to_event(lead)
+                if event is not None:
+                    events.append(event)
+            if len(page) < self.page_size:
+                break
+
+            last = max(lead.updated_at for lead in page if lead.updated_at is not None)
+            if last > cursor:
+                cursor, offset = last, 0
+            elif new_rows == 0:
+                # Página completa de leads con el mismo updated_at: solo en
+                # ese caso se avanza por offset dentro del empate
+                offset += self.page_size
+        events.sort(key=lambda e: e.lead.updated_at)
+        return events
+
+    def _to_event(self, lead: Lead) -> Optional[LeadEvent]:
+        if lead.id is None or lead.updated_at is None or lead.updated_at < self.watermark:
+            return None
+        if (lead.id, lead.updated_at.isoformat()) in self._seen:
+            return None
+        created = lead.created_at is not None and lead.created_at >= self.watermark
+        return LeadEvent(type=LeadEvent.CREATED if created else LeadEvent.UPDATED, lead=lead,
+                         source_event="poll")
+
+    def _advance(self, lead: Lead) -> None:
+        if lead.updated_at > self.watermark:
+            self.watermark = lead.updated_at
+            self._seen = set()
+        self._seen.add((lead.id, lead.updated_at.isoformat()))
+        if self.cursor_store is not None:
+            self.cursor_store.save(self.cursor())
+
+    def _adapt(self, had_activity: bool) -> None:
+        if had_activity:
+            self.interval = self.min_interval
+        else:
+            self.interval = min(self.max_interval, self.interval * self.backoff)
+
+    async def __aiter__(self) -> AsyncIterator[LeadEvent]:
+        while True:
+            events = await self.poll()
+            for event in events:
+                yield event
+                self._advance(event.lead)
+            self._adapt(bool(events))
+            await self._sleep(self.interval)
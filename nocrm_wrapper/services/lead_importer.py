@@ -0,0 +1,273 @@
+# src/services/lead_importer.py
+import asyncio
+import csv
+import json
+import logging
+import os
+from dataclasses import dataclass, fields
+from datetime import datetime
+from typing import Any, Dict, Iterator, Optional, Set, Tuple
+
+from ..models.lead import Lead
+from ..exceptions.nocrm_exceptions import NoCRMException, NoCRMValidationError
+from .lead_service import LeadService
+
+logger = logging.getLogger(__name__)
+
+_LEAD_FIELDS = {f.name for f in fields(Lead)} - {'id', 'created_at', 'updated_at', 'custom_fields'}
+_FLOAT_FIELDS = {'amount'}
+_INT_FIELDS = {'probability'}
+_DATETIME_FIELDS = {'expected_closing_date'}
+_STR_FIELDS = {'title', 'status', 'contact_name', 'description'}
+
+
+@dataclass
+class ImportResult:
+    """
+    Resumen de una ejecución de importación.
+
+    Attributes:
+        created: Leads creados en esta ejecución
+        rejected: Filas inválidas escritas en el archivo de rechazos
+        failed: Filas que fallaron al crearse, por errores de la API o inesperados
+            (se registran en el log y se reintentan al reanudar)
+        skipped: Filas omitidas por estar ya completadas en el checkpoint
+    """
+    created: int = 0
+    rejected: int = 0
+    failed: int = 0
+    skipped: int = 0
+
+
+class LeadImporter:
+    """
+    Pipeline de importación masiva de leads desde CSV o NDJSON, reanudable.
+
+    Lee el archivo fila a fila (sin cargarlo completo en memoria) y crea los
+    leads válidos de forma concurrente con las dos etapas de
+    `LeadService.create_lead` (`prepare_lead` y `create_prepared_lead`), por lo
+    que aplica las mismas validaciones e incluye la verificación local de
+    duplicados si el servicio tiene `duplicate_index`. La tasa de peticiones queda acotada por el
+    `RateLimiter` del repositorio (config.rate_limit).
+
+    - Checkpoint: archivo con un offset de fila completada por línea. Al
+      reanudar, las filas registradas se omiten.
+    - Rechazos: archivo NDJSON con las filas inválidas y el motivo.
+
+    Las filas que fallan por errores de la API no se registran en el checkpoint,
+    por lo que se reintentan en la siguiente ejecución.
+
+    Args:
+        service: Servicio de leads usado para validar y crear
+        checkpoint_path: Ruta del archivo de checkpoint
+        rejects_path: Ruta del archivo de rechazos
+        concurrency: Máximo de creaciones simultáneas
+
+    Example:
+        >>> importer = LeadImporter(client.leads, "leads.ckpt", "leads.rejects.ndjson")
+        >>> result = await importer.run("leads.csv")
+        >>> print(result.created, result.rejected)
+    """
+
+    def __init__(self,
+                 service: LeadService,
+                 checkpoint_path: str,
+                 rejects_path: str,
+                 concurrency: int = 5):
+        if concurrency < 1:
+            raise ValueError("Concurrency must be at least 1")
+        self.service = service
+        self.checkpoint_path = checkpoint_path
+        self.rejects_path = rejects_path
+        self.concurrency = concurrency
+
+    def load_checkpoint(self) -> Set[int]:
+        """
+        Lee los offsets de filas ya completadas.
+
+        Returns:
+            Set[int]: Offsets registrados (vacío si no hay checkpoint)
+        """
+        if not os.path.exists(self.checkpoint_path):
+            return set()
+        with open(self.checkpoint_path, encoding="utf-8") as f:
+            return {int(line) for line in f if line.strip()}
+
+    @staticmethod
+    def read_rows(path: str, file_format: Optional[str] = None) -> Iterator[Tuple[int, Any]]:
+        """
+        Lee las filas del archivo de forma perezosa.
+
+        Las líneas NDJSON se entregan sin decodificar para que una línea mal
+        formada se rechace individualmente (ver `parse_row`).
+
+        Args:
+            path: Ruta del archivo
+            file_format: "csv" o "ndjson" (por defecto se infiere de la extensión)
+
+        Yields:
+            Tuplas (offset de fila, diccionario de la fila CSV o línea NDJSON)
+        """
+        file_format = file_format or ("ndjson" if path.endswith((".ndjson", ".jsonl")) else "csv")
+        with open(path, newline="", encoding="utf-8") as f:
+            if file_format == "csv":
+                yield from enumerate(csv.DictReader(f))
+            elif file_format == "ndjson":
+                offset = 0
+                for line in f:
+                    if line.strip():
+                        yield offset, line.strip()
+                        offset += 1
+            else:
+                raise ValueError(f"Unsupported import format: {file_format}")
+
+    @staticmethod
+    def parse_row(row: Any) -> Dict:
+        """
+        Decodifica una fila leída por `read_rows`.
+
+        Args:
+            row: Diccionario de una fila CSV o línea NDJSON
+
+        Returns:
+            Dict: Datos de la fila
+
+        Raises:
+            NoCRMValidationError: Si la línea no es JSON válido o no es un objeto
+        """
+        if isinstance(row, str):
+            try:
+                row = json.loads(row)
+            except ValueError as e:
+                raise NoCRMValidationError(f"Invalid JSON: {e}")
+        if not isinstance(row, dict):
+            raise NoCRMValidationError(f"Row must be a JSON object, got {type(row).__name__}")
+        return row
+
+    @staticmethod
+    def row_to_lead(row: Dict) -> Lead:
+        """
+        Convierte una fila en Lead.
+
+        Los valores vacíos se ignoran, los campos numéricos y de fecha se
+        convierten desde texto y las columnas que no pertenecen al modelo se
+        guardan en `custom_fields`. Una columna `custom_fields` puede ser un
+        objeto o un objeto JSON serializado, y los campos de texto (título,
+        estado, contacto, descripción) deben ser cadenas.
+
+        Args:
+            row: Datos de la fila
+
+        Returns:
+            Lead: Lead construido a partir de la fila
+
+        Raises:
+            NoCRMValidationError: Si algún valor no puede convertirse
+        """
+        data: Dict = {}
+        custom_fields = row.get('custom_fields') or {}
+        if isinstance(custom_fields, str):
+            try:
+                custom_fields = json.loads(custom_fields)
+            except ValueError:
+                pass
+        if not isinstance(custom_fields, dict):
+            raise NoCRMValidationError(f"Invalid value for custom_fields: {row.get('custom_fields')!r}")
+        custom_fields = dict(custom_fields)
+        for key, value in row.items():
+            if key == 'custom_fields' or value is None or value == "":
+                continue
+            if key not in _LEAD_FIELDS:
+                custom_fields[key] = value
+                continue
+            if key in _STR_FIELDS and not isinstance(value, str):
+                raise NoCRMValidationError(f"Invalid value for {key}: {value!r}")
+            try:
+                if key in _FLOAT_FIELDS:
+                    value = float(value)
+                elif key in _INT_FIELDS:
+                    value = int(value)
+                elif key in _DATETIME_FIELDS:
+                    value = datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+            except (TypeError, ValueError):
+                raise NoCRMValidationError(f"Invalid value for {key}: {value!r}")
+            data[key] = value
+
+        if 'title' not in data:
+            raise NoCRMValidationError("Lead title is required and must be at least 3 characters")
+        data.setdefault('status', 'new')
+        if custom_fields:
+            data['custom_fields'] = custom_fields
+        return Lead(**data)
+
+    async def run(self, path: str, file_format: Optional[str] = None) -> ImportResult:
+        """
+        Ejecuta (o reanuda) la importación del archivo.
+
+        Args:
+            path: Ruta del archivo CSV o NDJSON
+            file_format: "csv" o "ndjson" (por defecto se infiere de la extensión)
+
+        Returns:
+            ImportResult: Resumen de la ejecución
+        """
+        done = self.load_checkpoint()
+        result = ImportResult()
+        semaphore = asyncio.Semaphore(self.concurrency)
+        tasks: Set[asyncio.Task] = set()
+
+        with open(self.checkpoint_path, "a", encoding="utf-8") as checkpoint, \
+                open(self.rejects_path, "a", encoding="utf-8") as rejects:
+
+            def mark_done(offset: int) -> None:
+                checkpoint.write(f"{offset}\n")
+                checkpoint.flush()
+
+            def reject(offset: int, row: Any, error: Exception) -> None:
+                rejects.write(json.dumps({"offset": offset, "row": row, "error": str(error)},
+                                         default=str) + "\n")
+                rejects.flush()
+                result.rejected += 1
+                mark_done(offset)
+
+            async def create(offset: int, lead: Lead, reservation: Optional[int]) -> None:
+                try:
+                    await self.service.create_prepared_lead(lead, reservation)
+                except NoCRMException as e:
+                    logger.warning("Lead import row %d failed: %s", offset, e)
+                    result.failed += 1
+                except Exception:
+                    logger.exception("Lead import row %d failed unexpectedly", offset)
+                    result.failed += 1
+                else:
+                    result.created += 1
+                    mark_done(offset)
+                finally:
+                    semaphore.release()
+
+            try:
+                for offset, row in self.read_rows(path, file_format):
+                    if offset in done:
+                        result.skipped += 1
+                        continue
+                    # La reserva de duplicados se toma con el semáforo ya adquirido para
+                    # que no quede pendiente si la importación se cancela esperándolo
+                    await semaphore.acquire()
+                    try:
+                        row = self.parse_row(row)
+                        lead = self.row_to_lead(row)
+                        reservation = self.service.prepare_lead(lead)
+                    except NoCRMValidationError as e:
+                        semaphore.release()
+                        reject(offset, row, e)
+                        continue
+
+                    task = asyncio.ensure_future(create(offset, lead, reservation))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+            finally:
+                # Solo espera las creaciones en curso: `create` ya registra sus errores
+                if tasks:
+                    await asyncio.gather(*tasks, return_exceptions=True)
+
+        return result
@@ -1,18 +1,29 @@
 # src/services/lead_service.py
-from typing import List, Optional, Dict
+from typing import AsyncIterator, List, Optional, Dict, Sequence
 from datetime import datetime
+import numpy as np
 from ..models.lead import Lead
+from ..models.lead_event import LeadEvent
 from ..repositories.lead_repository import LeadRepository
-from ..exceptions.nocrm_exceptions import NoCRMValidationError
+from ..repositories.deadline import deadline, gather_or_cancel
+from ..exceptions.nocrm_exceptions import NoCRMValidationError, NoCRMDuplicateLeadError
+from ..cache.duplicate_index import LeadDuplicateIndex
 from .base_service import BaseService
+from .change_feed import FileCursorStore, LeadChangeFeed
+
+TITLE_ERROR = "Lead title is required and must be at least 3 characters"
+AMOUNT_ERROR = "Lead amount cannot be negative"
+PROBABILITY_ERROR = "Lead probability must be between 0 and 100"
+CLOSING_DATE_ERROR = "Expected closing date cannot be in the past"
 
 
 class LeadService(BaseService[Lead]):
-    def __init__(self, repository: LeadRepository):
+    def __init__(self, repository: LeadRepository, duplicate_index: Optional[LeadDuplicateIndex] = None):
         super().__init__(repository)
         self.repository: LeadRepository = repository
+        self.duplicate_index = duplicate_index
 
-    async def create_lead(self, lead: Lead) -> Lead:
+    async def create_lead(self, lead: Lead, allow_duplicates: bool = False) -> Lead:
         """
         Crea un nuevo lead con validaciones de negocio.
         
@@ -22,13 +33,18 @@ class LeadService(BaseService[Lead]):
         - Probabilidad entre 0-100%
         - Fecha de cierre no en el pasado
         
+        Si el servicio tiene un `duplicate_index`, además verifica localmente
+        (sin peticiones a la API) que no exista un lead probablemente duplicado.
+        
         Args:
             lead: Instancia de Lead a crear
+            allow_duplicates: Omite la verificación de duplicados
         
         Returns:
             Lead: Lead creado con ID y timestamps asignados por el servidor
         
         Raises:
+            NoCRMDuplicateLeadError: Si el índice encuentra leads probablemente duplicados
             NoCRMValidationError: Si el lead no pasa las validaciones de negocio
             NoCRMAPIError: Si hay un error en la comunicación con la API
         
@@ -37,8 +53,53 @@ class LeadService(BaseService[Lead]):
             >>> created = await service.create_lead(new_lead)
             >>> print(created.id)  # ID asignado por NoCRM
         """
+        reservation = self.prepare_lead(lead, allow_duplicates=allow_duplicates)
+        return await self.create_prepared_lead(lead, reservation)
+
+    def prepare_lead(self, lead: Lead, allow_duplicates: bool = False) -> Optional[int]:
+        """
+        Primera etapa de `create_lead`: valida el lead y reserva su clave en el
+        índice de duplicados, sin peticiones a la API.
+
+        Es síncrona, así que dos creaciones concurrentes del mismo lead no
+        pueden pasar ambas la verificación. La reserva se libera en
+        `create_prepared_lead`, que debe llamarse siempre a continuación.
+
+        Args:
+            lead: Instancia de Lead a crear
+            allow_duplicates: Omite la verificación de duplicados
+
+        Returns:
+            Optional[int]: Token de la reserva (None si no hay índice o se omite la verificación)
+
+        Raises:
+            NoCRMDuplicateLeadError: Si el índice encuentra leads probablemente duplicados
+            NoCRMValidationError: Si el lead no pasa las validaciones de negocio
+        """
         self._validate_lead(lead)
-        return await self.repository.create(lead)
+        return None if allow_duplicates else self._check_duplicates(lead)
+
+    async def create_prepared_lead(self, lead: Lead, reservation: Optional[int] = None) -> Lead:
+        """
+        Segunda etapa de `create_lead`: crea en la API un lead ya preparado con
+        `prepare_lead`, libera su reserva y registra el lead creado en el índice.
+
+        Args:
+            lead: Lead devuelto a `prepare_lead`
+            reservation: Token devuelto por `prepare_lead`
+
+        Returns:
+            Lead: Lead creado con ID y timestamps asignados por el servidor
+
+        Raises:
+            NoCRMAPIError: Si hay un error en la comunicación con la API
+        """
+        try:
+            created = await self.repository.create(lead)
+        finally:
+            self._release(reservation)
+        self._index(created)
+        return created
 
     async def update_lead(self, id: int, lead: Lead) -> Lead:
         """
@@ -59,9 +120,12 @@ class LeadService(BaseService[Lead]):
         existing_lead = await self.repository.get(id)
         if not existing_lead:
             raise NoCRMValidationError(f"Lead with id {id} not found")
-        return await self.repository.update(id, lead)
+        updated = await self.repository.update(id, lead)
+        self._index(updated)
+        return updated
 
-    async def process_lead(self, id: int, user_id: int, step_name: str) -> Lead:
+    async def process_lead(self, id: int, user_id: int, step_name: str,
+                           timeout: Optional[float] = None) -> Lead:
         """
         Procesa un lead: asigna a un usuario y cambia su estado en una operación compuesta.
         
@@ -73,11 +137,13 @@ class LeadService(BaseService[Lead]):
             id: ID del lead a procesar
             user_id: ID del usuario al que se asignará el lead
             step_name: Nombre del paso (estado) al que mover el lead
+            timeout: Presupuesto total en segundos para ambas operaciones
         
         Returns:
             Lead: Lead actualizado con nueva asignación y estado
         
         Raises:
+            NoCRMTimeoutError: Si se agota el presupuesto `timeout`
             NoCRMAPIError: Si hay un error en cualquiera de las dos operaciones
         
         Example:
@@ -87,23 +153,27 @@ class LeadService(BaseService[Lead]):
             ...     step_name="Contactado"
             ... )
         """
-        # Primero asignamos el lead
-        assigned_lead = await self.repository.assign_lead(id, user_id)
+        with deadline(timeout):
+            # Primero asignamos el lead
+            assigned_lead = await self.repository.assign_lead(id, user_id)
 
-        # Luego cambiamos su estado
-        updated_lead = await self.repository.change_status(id, step_name)
+            # Luego cambiamos su estado
+            updated_lead = await self.repository.change_status(id, step_name)
 
         return updated_lead
 
-    async def get_lead_pipeline_status(self, id: int) -> Dict:
+    async def get_lead_pipeline_status(self, id: int, timeout: Optional[float] = None) -> Dict:
         """
         Obtiene información completa del estado del lead en el pipeline.
         
         Recupera no solo el lead, sino también información contextual del pipeline:
         el paso actual, el pipeline al que pertenece, y todos los pasos disponibles.
+        Las tres consultas se realizan en paralelo; si una falla o se agota el
+        presupuesto, las restantes se cancelan.
         
         Args:
             id: ID del lead
+            timeout: Presupuesto total en segundos para toda la operación
         
         Returns:
             Dict con las siguientes claves:
@@ -114,6 +184,7 @@ class LeadService(BaseService[Lead]):
         
         Raises:
             NoCRMValidationError: Si el lead no existe
+            NoCRMTimeoutError: Si se agota el presupuesto `timeout`
             NoCRMAPIError: Si hay un error en la comunicación con la API
         
         Example:
@@ -121,13 +192,15 @@ class LeadService(BaseService[Lead]):
             >>> print(f"Pipeline: {status['current_pipeline']['name']}")
             >>> print(f"Paso: {status['current_step']['name']}")
         """
-        lead = await self.repository.get(id)
+        with deadline(timeout):
+            lead, pipelines, steps = await gather_or_cancel(
+                self.repository.get(id),
+                self.repository.list_pipelines(),
+                self.repository.list_steps()
+            )
         if not lead:
             raise NoCRMValidationError(f"Lead with id {id} not found")
 
-        pipelines = await self.repository.list_pipelines()
-        steps = await self.repository.list_steps()
-
         current_step = next((step for step in steps if step['name'] == lead.status), None)
         current_pipeline = next((p for p in pipelines if p['id'] == current_step['pipeline_id']),
                                 None) if current_step else None
@@ -188,6 +261,76 @@ class LeadService(BaseService[Lead]):
 
         return await self.repository.list(**filters)
 
+    async def watch_leads(self,
+                          cursor_path: Optional[str] = None,
+                          since: Optional[datetime] = None,
+                          min_interval: float = 5.0,
+                          max_interval: float = 300.0) -> AsyncIterator[LeadEvent]:
+        """
+        Observa los cambios de leads como un generador asíncrono infinito.
+
+        Consulta periódicamente los leads actualizados después del último
+        `updated_at` visto, emite eventos de creación/actualización sin
+        duplicados y adapta el intervalo de polling a la actividad: se alarga
+        exponencialmente mientras no hay cambios y vuelve al mínimo cuando los hay.
+
+        Args:
+            cursor_path: Archivo donde persistir el cursor; al reiniciar, el
+                feed continúa desde ahí sin perder cambios ni repetir los ya procesados
+            since: Instante inicial si no hay cursor guardado (por defecto, ahora;
+                sin zona horaria se interpreta como hora local)
+            min_interval: Intervalo mínimo entre consultas, en segundos
+            max_interval: Intervalo máximo entre consultas, en segundos
+
+        Yields:
+            LeadEvent: Cada lead creado o actualizado
+
+        Raises:
+            NoCRMAPIError: Si hay un error en la comunicación con la API
+
+        Example:
+            >>> async for event in service.watch_leads(cursor_path="leads.cursor"):
+            ...     print(event.type, event.lead_id)
+        """
+        feed = LeadChangeFeed(
+            self.repository,
+            cursor_store=FileCursorStore(cursor_path) if cursor_path else None,
+            since=since,
+            min_interval=min_interval,
+            max_interval=max_interval
+        )
+        async for event in feed:
+            yield event
+
+    def _check_duplicates(self, lead: Lead) -> Optional[int]:
+        """
+        Verifica contra el índice local que el lead no esté duplicado y reserva
+        su clave hasta que la creación termine (ver `_release`).
+
+        Returns:
+            Optional[int]: Token de la reserva (None si no hay índice)
+
+        Raises:
+            NoCRMDuplicateLeadError: Si hay leads indexados (o en creación) probablemente duplicados
+        """
+        if self.duplicate_index is None:
+            return None
+        matches = self.duplicate_index.find_duplicates(lead)
+        if matches:
+            ids = ", ".join("pending" if id is None else str(id) for id, _ in matches)
+            raise NoCRMDuplicateLeadError(f"Lead likely duplicates existing leads: {ids}", matches=matches)
+        return self.duplicate_index.reserve(lead)
+
+    def _release(self, reservation: Optional[int]) -> None:
+        """Libera la reserva hecha por `_check_duplicates`"""
+        if self.duplicate_index is not None and reservation is not None:
+            self.duplicate_index.release(reservation)
+
+    def _index(self, lead: Lead) -> None:
+        """Registra el lead en el índice de duplicados (si está habilitado)"""
+        if self.duplicate_index is not None and lead.id is not None:
+            self.duplicate_index.add(lead)
+
     def _validate_lead(self, lead: Lead) -> None:
         """
         Validaciones de negocio para leads.
@@ -205,16 +348,65 @@ class LeadService(BaseService[Lead]):
             NoCRMValidationError: Si alguna validación falla
         """
         if not lead.title or len(lead.title.strip()) < 3:
-            raise NoCRMValidationError("Lead title is required and must be at least 3 characters")
+            raise NoCRMValidationError(TITLE_ERROR)
 
         if lead.amount is not None and lead.amount < 0:
-            raise NoCRMValidationError("Lead amount cannot be negative")
+            raise NoCRMValidationError(AMOUNT_ERROR)
 
         if lead.probability is not None and not 0 <= lead.probability <= 100:
-            raise NoCRMValidationError("Lead probability must be between 0 and 100")
+            raise NoCRMValidationError(PROBABILITY_ERROR)
+
+        if lead.expected_closing_date and \
+                lead.expected_closing_date < datetime.now(lead.expected_closing_date.tzinfo):
+            raise NoCRMValidationError(CLOSING_DATE_ERROR)
+
+    def validate_many(self, leads: Sequence[Lead], now: Optional[datetime] = None) -> List[List[str]]:
+        """
+        Valida un lote de leads con las mismas reglas que `_validate_lead`, sin lanzar excepciones.
+
+        Las reglas se evalúan de forma vectorizada sobre columnas NumPy y todas
+        las fechas se comparan contra un único instante de referencia, por lo
+        que el costo es despreciable incluso para decenas de miles de leads.
+
+        Args:
+            leads: Leads a validar
+            now: Instante de referencia para la fecha de cierre (por defecto, ahora)
+
+        Returns:
+            List[List[str]]: Para cada lead (en el mismo orden), la lista de
+            errores encontrados; una lista vacía indica que el lead es válido
+
+        Example:
+            >>> report = service.validate_many(leads)
+            >>> invalid = {i: errors for i, errors in enumerate(report) if errors}
+        """
+        count = len(leads)
+        if count == 0:
+            return []
+        reference = (now or datetime.now()).timestamp()
+
+        title_len = np.fromiter((len(l.title.strip()) if l.title else 0 for l in leads),
+                                dtype=np.int64, count=count)
+        amount = np.fromiter((np.nan if l.amount is None else l.amount for l in leads),
+                             dtype=np.float64, count=count)
+        probability = np.fromiter((np.nan if l.probability is None else l.probability for l in leads),
+                                  dtype=np.float64, count=count)
+        closing = np.fromiter((l.expected_closing_date.timestamp() if l.expected_closing_date else np.nan
+                               for l in leads), dtype=np.float64, count=count)
+
+        # NaN (campo ausente) da False en todas las comparaciones
+        failures = np.stack([
+            title_len < 3,
+            amount < 0,
+            (probability < 0) | (probability > 100),
+            closing < reference,
+        ])
+        messages = (TITLE_ERROR, AMOUNT_ERROR, PROBABILITY_ERROR, CLOSING_DATE_ERROR)
 
-        if lead.expected_closing_date and lead.expected_closing_date < datetime.now():
-            raise NoCRMValidationError("Expected closing date cannot be in the past")
+        report: List[List[str]] = [[] for _ in range(count)]
+        for rule, index in zip(*np.nonzero(failures)):
+            report[index].append(messages[rule])
+        return report
 
     async def list(self):
         """
@@ -0,0 +1,222 @@
+# src/services/sharded_sync.py
+import asyncio
+import json
+import multiprocessing
+import os
+import queue
+import time
+from dataclasses import astuple, dataclass, field
+from typing import Any, Dict, List, Optional
+
+from ..config.config import NoCRMConfig
+from ..exceptions.nocrm_exceptions import NoCRMException
+from ..models.lead import Lead
+from ..models.lead_event import LeadEvent
+from ..repositories.lead_repository import LeadRepository
+from ..repositories.rate_limiter import SharedRateLimiter
+
+_DONE = "done"
+_ERROR = "error"
+_BATCH = "batch"
+
+
+class NDJSONExportSink:
+    """
+    Sink que exporta los leads sincronizados a un archivo NDJSON.
+
+    Args:
+        path: Ruta del archivo de salida (se sobrescribe)
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = None
+
+    def write(self, leads: List[Lead]) -> None:
+        """Escribe un lote de leads, uno por línea"""
+        if self._file is None:
+            self._file = open(self.path, "w", encoding="utf-8")
+        for lead in leads:
+            data = lead.to_dict()
+            data.update(id=lead.id,
+                        created_at=lead.created_at.isoformat() if lead.created_at else None,
+                        updated_at=lead.updated_at.isoformat() if lead.updated_at else None)
+            self._file.write(json.dumps(data, default=str) + "\n")
+
+    def close(self) -> None:
+        """Cierra el archivo de salida"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class MirrorSink:
+    """
+    Sink que aplica los leads sincronizados a un mirror local.
+
+    Acepta cualquier destino que implemente `apply_event(event)` (TTLCache,
+    PipelineAnalytics, etc.); cada lead se aplica como LeadEvent.UPDATED.
+
+    Args:
+        target: Mirror, caché o agregado a actualizar
+    """
+
+    def __init__(self, target: Any):
+        self.target = target
+
+    def write(self, leads: List[Lead]) -> None:
+        for lead in leads:
+            self.target.apply_event(LeadEvent(type=LeadEvent.UPDATED, lead=lead, source_event="sync"))
+
+
+@dataclass
+class SyncResult:
+    """
+    Resumen de una sincronización completa.
+
+    Attributes:
+        leads: Leads escritos en el sink
+        pages: Páginas descargadas
+        duration: Duración total en segundos
+        per_shard: Leads descargados por cada shard
+    """
+    leads: int = 0
+    pages: int = 0
+    duration: float = 0.0
+    per_shard: Dict[int, int] = field(default_factory=dict)
+
+
+async def _sync_shard_async(shard: int, shards: int, config: Dict, filters: Dict,
+                            page_size: int, rate_limiter, results) -> None:
+    repository = LeadRepository(NoCRMConfig(**config), rate_limiter=rate_limiter)
+    try:
+        page_index = shard
+        while True:
+            leads = await repository.list(limit=page_size, offset=page_index * page_size, **filters)
+            if leads:
+                results.put((_BATCH, shard, [astuple(lead) for lead in leads]))
+            if len(leads) < page_size:
+                return
+            page_index += shards
+    finally:
+        await repository.close()
+
+
+def _sync_shard(shard: int, shards: int, config: Dict, filters: Dict,
+                page_size: int, rate_limiter, results) -> None:
+    """Punto de entrada de cada proceso de trabajo: un event loop y un pool propios"""
+    try:
+        asyncio.run(_sync_shard_async(shard, shards, config, filters, page_size, rate_limiter, results))
+    except BaseException as e:
+        results.put((_ERROR, shard, f"{type(e).__name__}: {e}"))
+    else:
+        results.put((_DONE, shard, None))
+
+
+class ShardedLeadSync:
+    """
+    Sincronización completa de leads repartida entre varios procesos.
+
+    El listado paginado se reparte en `workers` shards: el shard i descarga las
+    páginas i, i + workers, i + 2·workers, ... hasta encontrar una página
+    incompleta. Cada proceso tiene su propio event loop y pool de conexiones,
+    y hace la deserialización (`Lead.from_dict`) en paralelo con los demás,
+    mientras un `SharedRateLimiter` mantiene el presupuesto global de
+    peticiones por segundo. El proceso padre recibe los lotes y los escribe en
+    un único sink (export NDJSON o mirror local).
+
+    El listado debe tener un orden estable durante la sincronización para que
+    las páginas no se solapen.
+
+    Args:
+        api_key: API key de NoCRM
+        subdomain: Subdominio de la cuenta
+        workers: Cantidad de procesos (por defecto, os.cpu_count())
+        rate_limit: Peticiones por segundo para todos los procesos juntos
+        page_size: Leads por página
+        filters: Filtros adicionales del listado
+        start_method: Método de inicio de multiprocessing ("spawn", "fork", ...)
+        **options: Opciones adicionales de NoCRMConfig de cada worker
+
+    Example:
+        >>> sync = ShardedLeadSync(api_key="...", subdomain="...", workers=8, rate_limit=20)
+        >>> result = sync.run(NDJSONExportSink("leads.ndjson"))
+        >>> print(result.leads, result.duration)
+    """
+
+    def __init__(self,
+                 api_key: str,
+                 subdomain: str,
+                 workers: Optional[int] = None,
+                 rate_limit: Optional[float] = None,
+                 page_size: int = 100,
+                 filters: Optional[Dict] = None,
+                 start_method: Optional[str] = None,
+                 **options):
+        self.config = dict(options, api_key=api_key, subdomain=subdomain)
+        NoCRMConfig(**self.config)  # valida las opciones antes de lanzar procesos
+        self.workers = workers or os.cpu_count() or 1
+        self.rate_limit = rate_limit
+        self.page_size = page_size
+        self.filters = dict(filters or {})
+        self.context = multiprocessing.get_context(start_method)
+
+    def run(self, sink: Any) -> SyncResult:
+        """
+        Ejecuta la sincronización completa (bloqueante).
+
+        Args:
+            sink: Destino con un método `write(leads)` y, opcionalmente, `close()`
+
+        Returns:
+            SyncResult: Resumen de la sincronización
+
+        Raises:
+            NoCRMException: Si algún shard falla; el resto se detiene
+        """
+        started = time.monotonic()
+        results = self.context.Queue()
+        limiter = SharedRateLimiter(self.rate_limit, context=self.context) if self.rate_limit else None
+        processes = [
+            self.context.Process(
+                target=_sync_shard,
+                args=(shard, self.workers, self.config, self.filters, self.page_size, limiter, results),
+                daemon=True
+            )
+            for shard in range(self.workers)
+        ]
+        for process in processes:
+            process.start()
+
+        result = SyncResult(per_shard={shard: 0 for shard in range(self.workers)})
+        pending = set(range(self.workers))
+        try:
+            while pending:
+                try:
+                    kind, shard, payload = results.get(timeout=1)
+                except queue.Empty:
+                    dead = [s for s in pending if not processes[s].is_alive()]
+                    if dead and results.empty():
+                        raise NoCRMException(f"Sync worker {dead[0]} exited unexpectedly")
+                    continue
+                if kind == _BATCH:
+                    leads = [Lead(*row) for row in payload]
+                    sink.write(leads)
+                    result.leads += len(leads)
+                    result.pages += 1
+                    result.per_shard[shard] += len(leads)
+                elif kind == _ERROR:
+                    raise NoCRMException(f"Sync worker {shard} failed: {payload}")
+                else:
+                    pending.discard(shard)
+        finally:
+            for process in processes:
+                if process.is_alive() and pending:
+                    process.terminate()
+                process.join()
+            close = getattr(sink, "close", None)
+            if callable(close):
+                close()
+
+        result.duration = time.monotonic() - started
+        return result
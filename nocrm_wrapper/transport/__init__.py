@@ -0,0 +1,9 @@
+from .base import Transport, TransportResponse
+from .aiohttp_transport import AiohttpTransport
+from .cassette import Cassette, Interaction
+from .recording import RecordingTransport
+from .replay import ReplayTransport
+from .load_generator import LoadGenerator, LoadReport
+
+__all__ = ['Transport', 'TransportResponse', 'AiohttpTransport', 'Cassette', 'Interaction',
+           'RecordingTransport', 'ReplayTransport', 'LoadGenerator', 'LoadReport']
@@ -0,0 +1,100 @@
+import asyncio
+import warnings
+from typing import Dict, Optional
+
+import aiohttp
+
+from .base import Transport, TransportResponse
+
+
+class AiohttpTransport(Transport):
+    """
+    Transporte HTTP por defecto, basado en aiohttp.
+
+    Reutiliza una única sesión con pool de conexiones keep-alive y caché de
+    DNS, creada de forma perezosa en el event loop que la usa. Si el cliente
+    se usa desde otro event loop (por ejemplo, varias llamadas a
+    `asyncio.run`), la sesión se recrea automáticamente: la anterior se cierra
+    en su loop si sigue abierto o, si ya se cerró, se emite un ResourceWarning
+    (llamar a `close()` antes de que termine cada loop evita la fuga).
+
+    Args:
+        pool_size: Máximo de conexiones simultáneas del pool
+        dns_cache_ttl: Segundos que se cachean las resoluciones DNS
+    """
+
+    def __init__(self, pool_size: int = 10, dns_cache_ttl: int = 300):
+        self.pool_size = pool_size
+        self.dns_cache_ttl = dns_cache_ttl
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._loop is not loop:
+            self._discard_session()
+            connector = aiohttp.TCPConnector(limit=self.pool_size, ttl_dns_cache=self.dns_cache_ttl)
+            self._session = aiohttp.ClientSession(connector=connector)
+            self._loop = loop
+        return self._session
+
+    def _discard_session(self) -> None:
+        """Cierra (o avisa de) la sesión creada en un event loop anterior"""
+        session, loop = self._session, self._loop
+        self._session = self._loop = None
+        if session is None or session.closed or loop is None:
+            return
+        if not loop.is_closed():
+            asyncio.run_coroutine_threadsafe(session.close(), loop)
+            return
+        warnings.warn("AiohttpTransport session from a closed event loop was not closed; "
+                      "call close() (or use `async with NoCRMClient(...)`) before the loop ends",
+                      ResourceWarning, stacklevel=3)
+        session.detach()
+
+    async def request(self,
+                      method: str,
+                      url: str,
+                      headers: Dict[str, str],
+                      json: Optional[Dict] = None,
+                      params: Optional[Dict] = None,
+                      timeout: Optional[float] = None) -> TransportResponse:
+        async with self._get_session().request(
+                method=method,
+                url=url,
+                headers=headers,
+                json=json,
+                params=params,
+                timeout=aiohttp.ClientTimeout(total=timeout)
+        ) as response:
+            return TransportResponse(status=response.status, body=await response.read())
+
+    async def warmup(self, url: str, connections: int, timeout: Optional[float] = None) -> int:
+        """
+        Abre en paralelo hasta `connections` conexiones al host de `url`.
+
+        Envía peticiones HEAD concurrentes (sin credenciales) para resolver el
+        DNS y completar los handshakes TCP/TLS; las conexiones quedan en el pool
+        listas para reutilizarse. El código de estado de la respuesta se ignora.
+
+        Returns:
+            int: Cantidad de conexiones establecidas
+        """
+        session = self._get_session()
+
+        async def connect() -> bool:
+            try:
+                async with session.head(url, timeout=aiohttp.ClientTimeout(total=timeout),
+                                        allow_redirects=False):
+                    return True
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                return False
+
+        results = await asyncio.gather(*(connect() for _ in range(min(connections, self.pool_size))))
+        return sum(results)
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._loop = None
@@ -0,0 +1,69 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+
+@dataclass
+class TransportResponse:
+    """
+    Respuesta HTTP cruda devuelta por un transporte.
+
+    Attributes:
+        status: Código de estado HTTP
+        body: Body crudo de la respuesta
+    """
+    status: int
+    body: bytes
+
+
+class Transport(ABC):
+    """
+    Transporte HTTP usado por los repositorios para hablar con la API.
+
+    Separa el envío de bytes por la red de la lógica de `_make_request`
+    (rate limit, deadlines, métricas, decodificación y errores), lo que permite
+    grabar, reproducir o simular el tráfico sin tocar los repositorios.
+    """
+
+    @abstractmethod
+    async def request(self,
+                      method: str,
+                      url: str,
+                      headers: Dict[str, str],
+                      json: Optional[Dict] = None,
+                      params: Optional[Dict] = None,
+                      timeout: Optional[float] = None) -> TransportResponse:
+        """
+        Envía una petición HTTP.
+
+        Args:
+            method: Método HTTP
+            url: URL completa
+            headers: Headers de la petición
+            json: Body a enviar como JSON
+            params: Parámetros de query string
+            timeout: Timeout total en segundos
+
+        Returns:
+            TransportResponse: Estado y body crudo de la respuesta
+        """
+
+    async def warmup(self, url: str, connections: int, timeout: Optional[float] = None) -> int:
+        """
+        Pre-establece conexiones con el host de `url`.
+
+        Por defecto no hace nada; los transportes con pool de conexiones lo
+        redefinen.
+
+        Args:
+            url: URL del host a precalentar
+            connections: Cantidad de conexiones a abrir
+            timeout: Timeout de cada conexión en segundos
+
+        Returns:
+            int: Cantidad de conexiones establecidas
+        """
+        return 0
+
+    async def close(self) -> None:
+        """Libera los recursos del transporte (conexiones, archivos, etc.)"""
@@ -0,0 +1,107 @@
+import gzip
+import json
+from dataclasses import dataclass, asdict, field
+from typing import Any, Dict, List, Optional, Tuple
+
+REDACTED = "REDACTED"
+# Claves cuyo valor nunca se guarda en un cassette
+SENSITIVE_KEYS = {"x-api-key", "api_key", "apikey", "authorization", "token", "password", "secret"}
+
+
+def redact(value: Any) -> Any:
+    """
+    Reemplaza recursivamente los valores de claves sensibles por "REDACTED".
+
+    Args:
+        value: Diccionario, lista o valor simple
+
+    Returns:
+        Copia del valor con los datos sensibles ocultos
+    """
+    if isinstance(value, dict):
+        return {k: REDACTED if str(k).lower() in SENSITIVE_KEYS else redact(v)
+                for k, v in value.items()}
+    if isinstance(value, list):
+        return [redact(v) for v in value]
+    return value
+
+
+@dataclass
+class Interaction:
+    """
+    Un par petición/respuesta grabado.
+
+    Attributes:
+        method: Método HTTP
+        path: Path de la URL (sin host, para no depender del subdominio)
+        params: Parámetros de query string
+        body: Body JSON de la petición
+        status: Código de estado de la respuesta
+        response: Body crudo de la respuesta (texto)
+        offset: Segundos desde el inicio de la grabación hasta el envío
+        latency: Segundos que tardó la respuesta
+    """
+    method: str
+    path: str
+    params: Optional[Dict] = None
+    body: Optional[Any] = None
+    status: int = 200
+    response: str = ""
+    offset: float = 0.0
+    latency: float = 0.0
+
+    @property
+    def key(self) -> Tuple:
+        """Clave con la que se empareja una petición al reproducir"""
+        return _request_key(self.method, self.path, self.params, self.body)
+
+
+def _request_key(method: str, path: str, params: Optional[Dict], body: Optional[Any]) -> Tuple:
+    return (
+        method.upper(),
+        path.rstrip('/'),
+        json.dumps(params or {}, sort_keys=True, default=str),
+        json.dumps(body, sort_keys=True, default=str),
+    )
+
+
+@dataclass
+class Cassette:
+    """
+    Colección de interacciones grabadas, persistida como NDJSON comprimido con gzip.
+
+    Example:
+        >>> cassette = Cassette.load("trafico.ndjson.gz")
+        >>> len(cassette.interactions)
+    """
+    interactions: List[Interaction] = field(default_factory=list)
+
+    def add(self, interaction: Interaction) -> None:
+        """Agrega una interacción al cassette"""
+        self.interactions.append(interaction)
+
+    def save(self, path: str) -> None:
+        """
+        Guarda el cassette en disco (una interacción por línea, gzip).
+
+        Args:
+            path: Ruta del archivo
+        """
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            for interaction in sorted(self.interactions, key=lambda i: i.offset):
+                f.write(json.dumps(asdict(interaction), separators=(",", ":"), default=str) + "\n")
+
+    @classmethod
+    def load(cls, path: str) -> 'Cassette':
+        """
+        Carga un cassette desde disco.
+
+        Args:
+            path: Ruta del archivo
+
+        Returns:
+            Cassette: Cassette con las interacciones ordenadas por offset
+        """
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            interactions = [Interaction(**json.loads(line)) for line in f if line.strip()]
+        return cls(sorted(interactions, key=lambda i: i.offset))
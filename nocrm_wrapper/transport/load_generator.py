@@ -0,0 +1,127 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import List, Optional
+from urllib.parse import urlsplit
+
+from ..exceptions import NoCRMException
+from .cassette import Cassette, Interaction
+
+
+def _percentile(sorted_values: List[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+@dataclass
+class LoadReport:
+    """
+    Resultado de una reproducción de carga.
+
+    Attributes:
+        requests: Peticiones enviadas
+        errors: Peticiones que terminaron en error
+        duration: Duración total en segundos
+        throughput: Peticiones por segundo
+        p50, p95, p99, max: Latencias en segundos
+    """
+    requests: int
+    errors: int
+    duration: float
+    throughput: float
+    p50: float
+    p95: float
+    p99: float
+    max: float
+
+
+class LoadGenerator:
+    """
+    Reproduce un trace grabado contra un repositorio a N× la velocidad original.
+
+    Cada interacción del cassette se reenvía por `_make_request` del
+    repositorio (pasando por rate limit, deadlines, métricas y decodificación)
+    respetando su instante original dividido por `speed`. Combinado con un
+    `ReplayTransport` mide el throughput y la latencia de cola del propio
+    wrapper, sin depender de la red.
+
+    Args:
+        repository: Repositorio contra el que se reproduce el trace
+        cassette: Trace grabado
+        speed: Multiplicador de velocidad (2.0 = el doble de rápido)
+        concurrency: Máximo de peticiones en vuelo (None = sin límite)
+
+    Example:
+        >>> cassette = Cassette.load("trafico.ndjson.gz")
+        >>> client = NoCRMClient(api_key="offline", subdomain="replay",
+        ...                      transport=ReplayTransport(cassette, latency_scale=0.1))
+        >>> report = await LoadGenerator(client.repository, cassette, speed=10).run()
+        >>> print(report.throughput, report.p99)
+    """
+
+    def __init__(self, repository, cassette: Cassette, speed: float = 1.0,
+                 concurrency: Optional[int] = None):
+        if speed <= 0:
+            raise ValueError("Speed must be positive")
+        self.repository = repository
+        self.cassette = cassette
+        self.speed = speed
+        self.concurrency = concurrency
+        self._base_path = urlsplit(repository.base_url).path.rstrip('/')
+
+    def _endpoint(self, interaction: Interaction) -> str:
+        path = interaction.path
+        if path.startswith(self._base_path):
+            path = path[len(self._base_path):]
+        return path.lstrip('/')
+
+    async def run(self) -> LoadReport:
+        """
+        Ejecuta la reproducción completa.
+
+        Returns:
+            LoadReport: Throughput y latencias observadas
+        """
+        semaphore = asyncio.Semaphore(self.concurrency) if self.concurrency else None
+        latencies: List[float] = []
+        errors = 0
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+
+        async def send(interaction: Interaction) -> None:
+            nonlocal errors
+            delay = started + interaction.offset / self.speed - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            if semaphore is not None:
+                await semaphore.acquire()
+            sent = time.perf_counter()
+            try:
+                await self.repository._make_request(
+                    interaction.method,
+                    self._endpoint(interaction),
+                    data=interaction.body,
+                    params=interaction.params
+                )
+            except (NoCRMException, LookupError):
+                errors += 1
+            finally:
+                latencies.append(time.perf_counter() - sent)
+                if semaphore is not None:
+                    semaphore.release()
+
+        await asyncio.gather(*(send(i) for i in self.cassette.interactions))
+        duration = loop.time() - started
+        latencies.sort()
+        return LoadReport(
+            requests=len(latencies),
+            errors=errors,
+            duration=duration,
+            throughput=len(latencies) / duration if duration > 0 else 0.0,
+            p50=_percentile(latencies, 0.50),
+            p95=_percentile(latencies, 0.95),
+            p99=_percentile(latencies, 0.99),
+            max=latencies[-1] if latencies else 0.0,
+        )
@@ -0,0 +1,59 @@
+import time
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+from .base import Transport, TransportResponse
+from .cassette import Cassette, Interaction, redact
+
+
+class RecordingTransport(Transport):
+    """
+    Transporte que delega en otro y graba cada par petición/respuesta en un Cassette.
+
+    Las claves sensibles (API key, tokens, etc.) de parámetros y bodies se
+    redactan antes de guardarse; los headers y el host no se graban.
+
+    Args:
+        inner: Transporte real al que se delegan las peticiones
+        cassette: Cassette donde se graban las interacciones (por defecto, uno nuevo)
+
+    Example:
+        >>> recorder = RecordingTransport(AiohttpTransport())
+        >>> client = NoCRMClient(api_key="...", subdomain="...", transport=recorder)
+        >>> ...
+        >>> recorder.cassette.save("trafico.ndjson.gz")
+    """
+
+    def __init__(self, inner: Transport, cassette: Optional[Cassette] = None):
+        self.inner = inner
+        self.cassette = cassette if cassette is not None else Cassette()
+        self._started: Optional[float] = None
+
+    async def request(self,
+                      method: str,
+                      url: str,
+                      headers: Dict[str, str],
+                      json: Optional[Dict] = None,
+                      params: Optional[Dict] = None,
+                      timeout: Optional[float] = None) -> TransportResponse:
+        sent = time.monotonic()
+        if self._started is None:
+            self._started = sent
+        response = await self.inner.request(method, url, headers, json=json, params=params, timeout=timeout)
+        self.cassette.add(Interaction(
+            method=method.upper(),
+            path=urlsplit(url).path,
+            params=redact(params) if params else None,
+            body=redact(json) if json is not None else None,
+            status=response.status,
+            response=response.body.decode("utf-8", errors="replace"),
+            offset=sent - self._started,
+            latency=time.monotonic() - sent,
+        ))
+        return response
+
+    async def warmup(self, url: str, connections: int, timeout: Optional[float] = None) -> int:
+        return await self.inner.warmup(url, connections, timeout=timeout)
+
+    async def close(self) -> None:
+        await self.inner.close()
@@ -0,0 +1,69 @@
+import asyncio
+from collections import defaultdict, deque
+from typing import Deque, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+from .base import Transport, TransportResponse
+from .cassette import Cassette, Interaction, _request_key, redact
+
+
+class ReplayTransport(Transport):
+    """
+    Transporte que sirve respuestas grabadas en un Cassette, sin acceso a la red.
+
+    Cada petición se empareja por método, path, parámetros y body. Si la misma
+    petición se grabó varias veces, las respuestas se devuelven en el orden
+    grabado y luego se repiten cíclicamente, de modo que la reproducción es
+    determinista.
+
+    Args:
+        cassette: Cassette con las interacciones grabadas
+        latency_scale: Factor aplicado a la latencia grabada (1.0 = original,
+            0 = sin espera, 0.5 = el doble de rápido)
+
+    Raises:
+        LookupError: Al reproducir una petición que no está en el cassette
+
+    Example:
+        >>> transport = ReplayTransport(Cassette.load("trafico.ndjson.gz"), latency_scale=0)
+        >>> client = NoCRMClient(api_key="offline", subdomain="replay", transport=transport)
+    """
+
+    def __init__(self, cassette: Cassette, latency_scale: float = 1.0):
+        if latency_scale < 0:
+            raise ValueError("Latency scale cannot be negative")
+        self.latency_scale = latency_scale
+        self._recorded: Dict[Tuple, Tuple[Interaction, ...]] = {}
+        grouped = defaultdict(list)
+        for interaction in cassette.interactions:
+            grouped[interaction.key].append(interaction)
+        self._recorded = {key: tuple(items) for key, items in grouped.items()}
+        self._queues: Dict[Tuple, Deque[Interaction]] = {}
+
+    def _next(self, key: Tuple) -> Interaction:
+        recorded = self._recorded.get(key)
+        if not recorded:
+            raise LookupError(f"No recorded interaction for {key[0]} {key[1]}")
+        queue = self._queues.get(key)
+        if not queue:
+            queue = self._queues[key] = deque(recorded)
+        return queue.popleft()
+
+    async def request(self,
+                      method: str,
+                      url: str,
+                      headers: Dict[str, str],
+                      json: Optional[Dict] = None,
+                      params: Optional[Dict] = None,
+                      timeout: Optional[float] = None) -> TransportResponse:
+        key = _request_key(method, urlsplit(url).path,
+                           redact(params) if params else None,
+                           redact(json) if json is not None else None)
+        interaction = self._next(key)
+        delay = interaction.latency * self.latency_scale
+        if delay > 0:
+            if timeout is not None and delay > timeout:
+                await asyncio.sleep(timeout)
+                raise asyncio.TimeoutError()
+            await asyncio.sleep(delay)
+        return TransportResponse(status=interaction.status, body=interaction.response.encode("utf-8"))
@@ -0,0 +1,3 @@
+from .receiver import WebhookReceiver
+
+__all__ = ['WebhookReceiver']
@@ -0,0 +1,213 @@
+import asyncio
+import hashlib
+import hmac
+import json
+import logging
+from typing import Any, Awaitable, Callable, List, Optional, Union
+
+from aiohttp import web
+
+from ..models import Lead, LeadEvent
+
+logger = logging.getLogger(__name__)
+
+Subscriber = Callable[[LeadEvent], Union[None, Awaitable[None]]]
+
+# Eventos de NoCRM que se traducen a un tipo distinto de LeadEvent.UPDATED
+_EVENT_TYPES = {
+    "lead.creation": LeadEvent.CREATED,
+    "lead.deleted": LeadEvent.DELETED,
+}
+
+
+class WebhookReceiver:
+    """
+    Receptor local de webhooks de NoCRM basado en aiohttp.
+
+    Verifica la firma de cada payload, traduce los eventos de leads a
+    `LeadEvent` y los distribuye inmediatamente a:
+
+    - sinks: cachés o mirrors locales que implementan `apply_event(event)`
+      (por ejemplo `TTLCache`), que se actualizan antes que los suscriptores
+    - suscriptores: callables (sync o async) que reciben el evento
+
+    La firma se valida como HMAC-SHA256 (hex) del body crudo usando el secreto
+    compartido configurado en el webhook. El secreto es obligatorio: aceptar
+    payloads sin firmar requiere activar `allow_unsigned` explícitamente (por
+    ejemplo, en tests o detrás de un proxy que ya autentica las peticiones).
+
+    Args:
+        secret: Secreto compartido para verificar la firma de los payloads
+        path: Ruta HTTP en la que se reciben los webhooks
+        signature_header: Header HTTP que contiene la firma
+        allow_unsigned: Acepta payloads sin verificar la firma si no hay `secret`
+
+    Raises:
+        ValueError: Si no se configura `secret` ni `allow_unsigned`
+
+    Example:
+        >>> receiver = WebhookReceiver(secret="s3cr3t")
+        >>> receiver.attach(client.repository.cache)
+        >>> receiver.subscribe(lambda event: print(event.type, event.lead_id))
+        >>> await receiver.start(port=8080)
+    """
+
+    def __init__(self,
+                 secret: Optional[str] = None,
+                 path: str = "/webhooks/nocrm",
+                 signature_header: str = "X-NoCRM-Signature",
+                 allow_unsigned: bool = False):
+        if secret is None and not allow_unsigned:
+            raise ValueError("A webhook secret is required (pass allow_unsigned=True to skip verification)")
+        self.secret = secret
+        self.allow_unsigned = allow_unsigned
+        self.path = path
+        self.signature_header = signature_header
+        self._subscribers: List[Subscriber] = []
+        self._sinks: List[Any] = []
+        self._runner: Optional[web.AppRunner] = None
+
+    def subscribe(self, callback: Subscriber) -> Subscriber:
+        """
+        Registra un suscriptor. Puede usarse como decorador.
+
+        Args:
+            callback: Función o corrutina que recibe cada LeadEvent
+
+        Returns:
+            El mismo callback recibido
+        """
+        self._subscribers.append(callback)
+        return callback
+
+    def unsubscribe(self, callback: Subscriber) -> None:
+        """Elimina un suscriptor previamente registrado"""
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+
+    def attach(self, sink: Any) -> None:
+        """
+        Registra una caché o mirror local que se actualiza con cada evento.
+
+        Args:
+            sink: Objeto que implementa `apply_event(event: LeadEvent)`
+        """
+        if not callable(getattr(sink, "apply_event", None)):
+            raise TypeError("Webhook sinks must implement apply_event(event)")
+        self._sinks.append(sink)
+
+    def sign(self, body: bytes) -> str:
+        """Calcula la firma esperada para `body` (útil para simular webhooks)"""
+        if self.secret is None:
+            raise ValueError("A secret is required to sign payloads")
+        return hmac.new(self.secret.encode(), body, hashlib.sha256).hexdigest()
+
+    def verify(self, body: bytes, signature: Optional[str]) -> bool:
+        """
+        Verifica la firma de un payload.
+
+        Args:
+            body: Body crudo de la petición
+            signature: Firma recibida en el header configurado
+
+        Returns:
+            bool: True si la firma es válida o si se permiten payloads sin firmar
+        """
+        if self.secret is None:
+            return self.allow_unsigned
+        if not signature:
+            return False
+        return hmac.compare_digest(self.sign(body), signature)
+
+    def parse(self, payload: dict) -> Optional[LeadEvent]:
+        """
+        Traduce un payload de webhook de NoCRM a LeadEvent.
+
+        Acepta tanto el formato envuelto (`{"webhook_event": {...}}`) como el
+        evento directo. Los eventos que no son de leads se ignoran.
+
+        Args:
+            payload: Payload JSON decodificado
+
+        Returns:
+            Optional[LeadEvent]: Evento traducido o None si no aplica
+        """
+        event = payload.get("webhook_event", payload)
+        name = event.get("event") or ""
+        data = event.get("data")
+        if not name.startswith("lead.") or not isinstance(data, dict):
+            return None
+
+        lead = Lead.from_dict(dict(data))
+        return LeadEvent(
+            type=_EVENT_TYPES.get(name, LeadEvent.UPDATED),
+            lead=lead,
+            source_event=name
+        )
+
+    async def dispatch(self, event: LeadEvent) -> None:
+        """
+        Distribuye un evento a sinks y suscriptores.
+
+        Los errores de un sink o suscriptor se registran en el log y no
+        impiden que el resto reciba el evento.
+
+        Args:
+            event: Evento a distribuir
+        """
+        for sink in self._sinks:
+            try:
+                result = sink.apply_event(event)
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception:
+                logger.exception("Webhook sink %r failed to apply event", sink)
+
+        for callback in list(self._subscribers):
+            try:
+                result = callback(event)
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception:
+                logger.exception("Webhook subscriber %r failed", callback)
+
+    async def handle(self, request: web.Request) -> web.Response:
+        """Handler aiohttp para las peticiones de webhook"""
+        body = await request.read()
+        if not self.verify(body, request.headers.get(self.signature_header)):
+            return web.json_response({"error": "invalid signature"}, status=401)
+
+        try:
+            payload = json.loads(body)
+            event = self.parse(payload)
+        except (ValueError, TypeError, AttributeError) as e:
+            return web.json_response({"error": f"invalid payload: {e}"}, status=400)
+
+        if event is not None:
+            await self.dispatch(event)
+        return web.json_response({"received": event is not None})
+
+    def make_app(self) -> web.Application:
+        """Crea la aplicación aiohttp con la ruta del webhook registrada"""
+        app = web.Application()
+        app.router.add_post(self.path, self.handle)
+        return app
+
+    async def start(self, host: str = "0.0.0.0", port: int = 8080) -> None:
+        """
+        Inicia el servidor HTTP del receptor.
+
+        Args:
+            host: Interfaz en la que escuchar
+            port: Puerto en el que escuchar
+        """
+        self._runner = web.AppRunner(self.make_app())
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+
+    async def stop(self) -> None:
+        """Detiene el servidor HTTP del receptor"""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
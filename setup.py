@@ -8,6 +8,7 @@ setup(
         "flask>=2.3.3",
         "flask-cors>=4.0.0",
         "aiohttp>=3.8.5",
+        "numpy>=1.21",
         "python-dotenv>=1.0.0",
     ],
     extras_require={
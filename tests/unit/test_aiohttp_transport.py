@@ -0,0 +1,73 @@
+import asyncio
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from nocrm_wrapper.config import NoCRMConfig
+from nocrm_wrapper.nocrm_client import NoCRMClient
+from nocrm_wrapper.repositories.lead_repository import LeadRepository
+from nocrm_wrapper.transport import AiohttpTransport
+
+
+def _app():
+    async def handler(request):
+        return web.json_response({"id": 7, "title": "Deal", "status": "new"})
+
+    app = web.Application()
+    app.router.add_route("*", "/{tail:.*}", handler)
+    return app
+
+
+@pytest.mark.asyncio
+async def test_repository_close_closes_the_transport_it_created():
+    async with TestServer(_app()) as server:
+        repository = LeadRepository(NoCRMConfig(api_key="key", subdomain="acme",
+                                                base_url=str(server.make_url("/api/v2"))))
+        await repository.get(7)
+        session = repository.transport._session
+
+        await repository.close()
+
+    assert session.closed
+
+
+@pytest.mark.asyncio
+async def test_repository_close_keeps_shared_transport_open():
+    transport = AiohttpTransport()
+    async with TestServer(_app()) as server:
+        repository = LeadRepository(NoCRMConfig(api_key="key", subdomain="acme",
+                                                base_url=str(server.make_url("/api/v2"))),
+                                    transport=transport)
+        await repository.get(7)
+
+        await repository.close()
+        assert not transport._session.closed
+        await transport.close()
+
+
+@pytest.mark.asyncio
+async def test_client_context_manager_closes_session():
+    async with TestServer(_app()) as server:
+        async with NoCRMClient(api_key="key", subdomain="acme",
+                               base_url=str(server.make_url("/api/v2"))) as client:
+            await client.repository.get(7)
+            session = client.transport._session
+
+    assert session.closed
+
+
+def test_session_from_a_closed_loop_is_reported():
+    transport = AiohttpTransport()
+
+    async def open_session(close=False):
+        session = transport._get_session()
+        if close:
+            await transport.close()
+        return session
+
+    first = asyncio.run(open_session())
+    with pytest.warns(ResourceWarning, match="closed event loop"):
+        second = asyncio.run(open_session(close=True))
+
+    assert first.closed and second.closed
@@ -0,0 +1,102 @@
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from nocrm_wrapper.models import Lead, LeadEvent
+from nocrm_wrapper.services.change_feed import FileCursorStore, LeadChangeFeed
+
+T0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _lead(id, updated_minutes, created_minutes=-60):
+    return Lead(title=f"Deal {id}", status="new", id=id,
+                created_at=T0 + timedelta(minutes=created_minutes),
+                updated_at=T0 + timedelta(minutes=updated_minutes))
+
+
+def _feed(polls, cursor_store=None, sleeps=None):
+    repository = MagicMock()
+    repository.list = AsyncMock(side_effect=polls)
+
+    async def sleep(seconds):
+        sleeps.append(seconds)
+
+    return LeadChangeFeed(repository, cursor_store=cursor_store, since=T0, min_interval=1,
+                          max_interval=8, page_size=10, sleep=sleep), repository
+
+
+async def _take(feed, count):
+    events = []
+    async for event in feed:
+        events.append(event)
+        if len(events) == count:
+            break
+    return events
+
+
+@pytest.mark.asyncio
+async def test_feed_emits_deduplicated_events_and_adapts_interval():
+    sleeps = []
+    polls = [[], [], [_lead(1, 5, created_minutes=5), _lead(2, 5)], [_lead(2, 5)], [], [_lead(2, 9)]]
+    feed, repository = _feed(polls, sleeps=sleeps)
+
+    events = await _take(feed, 3)
+
+    assert [(e.lead_id, e.type) for e in events] == [(1, LeadEvent.CREATED), (2, LeadEvent.UPDATED),
+                                                       (2, LeadEvent.UPDATED)]
+    assert sleeps == [2, 4, 1, 2, 4]
+    assert repository.list.await_args.kwargs["updated_after"] == (T0 + timedelta(minutes=5)).isoformat()
+
+
+@pytest.mark.asyncio
+async def test_feed_resumes_from_persisted_cursor(tmp_path):
+    store = FileCursorStore(str(tmp_path / "leads.cursor"))
+    feed, _ = _feed([[_lead(1, 5), _lead(2, 5), _lead(3, 5)]], cursor_store=store, sleeps=[])
+    await _take(feed, 2)  # el evento 1 queda procesado; el 2 estaba en curso
+
+    resumed, repository = _feed([[_lead(1, 5), _lead(2, 5), _lead(3, 5)]], cursor_store=store, sleeps=[])
+    events = await _take(resumed, 2)
+
+    assert [e.lead_id for e in events] == [2, 3]
+    assert repository.list.await_args.kwargs["updated_after"] == (T0 + timedelta(minutes=5)).isoformat()
+
+
+@pytest.mark.asyncio
+async def test_poll_does_not_skip_rows_when_leads_change_between_pages():
+    leads = {id: _lead(id, id) for id in range(1, 5)}
+    calls = []
+
+    async def list_leads(updated_after, limit, offset, **kwargs):
+        calls.append(updated_after)
+        if len(calls) == 2:
+            leads[1] = _lead(1, 10)  # lead 1 se actualiza entre páginas
+        since = datetime.fromisoformat(updated_after)
+        rows = sorted((l for l in leads.values() if l.updated_at >= since), key=lambda l: l.updated_at)
+        return rows[offset:offset + limit]
+
+    repository = MagicMock()
+    repository.list = list_leads
+    feed = LeadChangeFeed(repository, since=T0, page_size=2)
+
+    events = await feed.poll()
+
+    assert [(e.lead_id, int((e.lead.updated_at - T0).total_seconds() // 60)) for e in events] == \
+        [(1, 1), (2, 2), (3, 3), (4, 4), (1, 10)]
+
+
+@pytest.mark.asyncio
+async def test_naive_since_and_cursor_are_treated_as_local_time(tmp_path):
+    naive = T0.astimezone().replace(tzinfo=None)
+    repository = MagicMock()
+    repository.list = AsyncMock(return_value=[_lead(1, 5)])
+
+    feed = LeadChangeFeed(repository, since=naive)
+    [event] = await feed.poll()
+
+    assert feed.watermark == T0
+    assert event.lead_id == 1
+
+    store = FileCursorStore(str(tmp_path / "leads.cursor"))
+    store.save({"watermark": naive.isoformat(), "seen": []})
+    assert LeadChangeFeed(repository, cursor_store=store).watermark == T0
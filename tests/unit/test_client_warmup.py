@@ -0,0 +1,72 @@
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from nocrm_wrapper.exceptions import NoCRMAuthenticationError
+from nocrm_wrapper.nocrm_client import NoCRMClient
+
+
+def _app(hits):
+    async def handler(request):
+        hits.append((request.method, request.path))
+        if request.headers.get("X-API-KEY") == "bad":
+            return web.json_response({"message": "unauthorized"}, status=401)
+        if request.path.endswith("/pipelines"):
+            return web.json_response([{"id": 1, "name": "Sales"}])
+        if request.path.endswith("/steps"):
+            return web.json_response([{"name": "new", "pipeline_id": 1}])
+        return web.json_response({"id": 7, "title": "Deal", "status": "new"})
+
+    app = web.Application()
+    app.router.add_route("*", "/{tail:.*}", handler)
+    return app
+
+
+@pytest.mark.asyncio
+async def test_warmup_opens_connections_and_preloads_reference_data():
+    hits = []
+    async with TestServer(_app(hits)) as server:
+        client = NoCRMClient(api_key="key", subdomain="acme",
+                             base_url=str(server.make_url("/api/v2")), pool_size=4)
+        try:
+            summary = await client.warmup()
+            hits.clear()
+            status = await client.leads.get_lead_pipeline_status(7)
+        finally:
+            await client.close()
+
+    assert summary == {"connections": 4, "pipelines": 1, "steps": 1}
+    assert hits == [("GET", "/api/v2/leads/7")]
+    assert status["current_pipeline"]["name"] == "Sales"
+
+
+@pytest.mark.asyncio
+async def test_warmup_validates_api_key():
+    async with TestServer(_app([])) as server:
+        client = NoCRMClient(api_key="bad", subdomain="acme", base_url=str(server.make_url("/api/v2")))
+        try:
+            with pytest.raises(NoCRMAuthenticationError):
+                await client.warmup()
+        finally:
+            await client.close()
+
+
+@pytest.mark.asyncio
+async def test_reference_cache_is_off_until_enabled_and_returns_copies():
+    hits = []
+    async with TestServer(_app(hits)) as server:
+        client = NoCRMClient(api_key="key", subdomain="acme", base_url=str(server.make_url("/api/v2")))
+        try:
+            await client.repository.list_pipelines()
+            await client.repository.list_pipelines()
+            assert len(hits) == 2
+
+            await client.warmup(connections=1)
+            hits.clear()
+            pipelines = await client.repository.list_pipelines()
+            pipelines.clear()
+            assert await client.repository.list_pipelines() == [{"id": 1, "name": "Sales"}]
+        finally:
+            await client.close()
+
+    assert hits == []
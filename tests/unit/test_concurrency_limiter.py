@@ -0,0 +1,71 @@
+import asyncio
+
+import pytest
+
+from nocrm_wrapper.exceptions import NoCRMAPIError
+from nocrm_wrapper.nocrm_client import NoCRMClient
+from nocrm_wrapper.repositories import AdaptiveConcurrencyLimiter
+from nocrm_wrapper.repositories.concurrency_limiter import endpoint_key
+from nocrm_wrapper.transport import Transport, TransportResponse
+
+
+def test_limit_grows_while_latency_is_flat_and_shrinks_on_spikes():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=4, max_limit=10, backoff_ratio=0.5)
+    limiter.in_flight = 4
+    for _ in range(3):
+        limiter.in_flight += 1
+        limiter.release(latency=0.1)
+    assert limiter.limit == 7
+
+    limiter.in_flight += 1
+    limiter.release(latency=1.0)
+    assert limiter.limit == 3
+
+    limiter.in_flight += 1
+    limiter.release(dropped=True)
+    assert limiter.limit == 1
+
+
+def test_latency_baseline_is_kept_per_route():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=10, max_limit=20)
+    get_one, list_all = endpoint_key("GET", "leads/7"), endpoint_key("GET", "leads")
+    assert (get_one, list_all) == ("GET leads/{id}", "GET leads")
+
+    for _ in range(5):
+        for key, latency in ((get_one, 0.05), (list_all, 0.12)):
+            limiter.in_flight = limiter.limit
+            limiter.release(latency=latency, key=key)
+
+    assert limiter.limit == 20
+
+
+@pytest.mark.asyncio
+async def test_acquire_blocks_at_limit_until_release():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=1)
+    await limiter.acquire()
+
+    waiter = asyncio.ensure_future(limiter.acquire())
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    limiter.release(latency=0.1)
+    await asyncio.wait_for(waiter, 1)
+    assert limiter.in_flight == 1
+
+
+class ThrottledTransport(Transport):
+    async def request(self, method, url, headers, json=None, params=None, timeout=None):
+        return TransportResponse(status=429, body=b'{"message": "Too many requests"}')
+
+
+@pytest.mark.asyncio
+async def test_429_responses_shrink_limit_and_publish_metric():
+    client = NoCRMClient(api_key="key", subdomain="acme", transport=ThrottledTransport(),
+                         adaptive_concurrency=True)
+
+    with pytest.raises(NoCRMAPIError):
+        await client.repository.list()
+
+    assert client.concurrency_limiter.limit == 9
+    assert client.metrics.snapshot()["gauges"]["concurrency_limit"] == 9
+    assert client.concurrency_limiter.in_flight == 0
@@ -0,0 +1,68 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from nocrm_wrapper.config import NoCRMConfig
+from nocrm_wrapper.exceptions import NoCRMTimeoutError
+from nocrm_wrapper.models import Lead
+from nocrm_wrapper.repositories import LeadRepository, deadline
+from nocrm_wrapper.repositories.deadline import remaining
+from nocrm_wrapper.services.lead_service import LeadService
+
+
+def _slow_repository(delay):
+    repository = LeadRepository(NoCRMConfig(api_key="key", subdomain="acme", timeout=30))
+    seen_timeouts = []
+
+    async def send(method, url, data=None, params=None, timeout=None, **kwargs):
+        seen_timeouts.append(timeout)
+        await asyncio.sleep(delay)
+        return {"id": 1, "title": "Deal", "status": "new"}
+
+    repository._send = send
+    return repository, seen_timeouts
+
+
+@pytest.mark.asyncio
+async def test_deadline_shrinks_request_timeout_and_raises_when_exhausted():
+    repository, seen_timeouts = _slow_repository(delay=0.05)
+    service = LeadService(repository)
+
+    with pytest.raises(NoCRMTimeoutError):
+        await service.process_lead(1, user_id=2, step_name="won", timeout=0.08)
+
+    assert len(seen_timeouts) == 2
+    assert seen_timeouts[0] <= 0.08
+    assert seen_timeouts[1] < seen_timeouts[0]
+
+
+@pytest.mark.asyncio
+async def test_failed_branch_cancels_in_flight_siblings():
+    cancelled = asyncio.Event()
+
+    async def slow_steps():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    repository = MagicMock()
+    repository.get = AsyncMock(return_value=Lead(title="Deal", status="new", id=1))
+    repository.list_pipelines = AsyncMock(side_effect=RuntimeError("boom"))
+    repository.list_steps = slow_steps
+    service = LeadService(repository)
+
+    with pytest.raises(RuntimeError):
+        await service.get_lead_pipeline_status(1, timeout=1)
+
+    assert cancelled.is_set()
+
+
+def test_nested_deadline_never_extends_outer_budget():
+    with deadline(1):
+        outer = remaining()
+        with deadline(60):
+            assert remaining() <= outer
+    assert remaining() is None
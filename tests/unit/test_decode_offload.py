@@ -0,0 +1,72 @@
+import json
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from nocrm_wrapper.exceptions import NoCRMAPIError
+from nocrm_wrapper.models import Lead
+from nocrm_wrapper.nocrm_client import NoCRMClient
+from nocrm_wrapper.repositories.offload import DecodeOffloader
+from nocrm_wrapper.transport import Transport, TransportResponse
+
+ROWS = [{"id": i, "title": f"Deal {i}", "status": "new", "created_at": "2026-01-01T00:00:00Z"}
+        for i in range(50)]
+BODY = json.dumps(ROWS).encode()
+
+
+class StaticTransport(Transport):
+    def __init__(self, body=BODY):
+        self.body = body
+
+    async def request(self, method, url, headers, json=None, params=None, timeout=None):
+        return TransportResponse(status=200, body=self.body)
+
+
+@pytest.mark.asyncio
+async def test_large_responses_are_decoded_in_process_pool():
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        offloader = DecodeOffloader(threshold=100, executor=executor)
+
+        leads = await offloader.decode_leads(BODY)
+
+    assert len(leads) == 50
+    assert leads[3] == Lead.from_dict(dict(ROWS[3]))
+    assert leads[3].created_at.tzinfo is not None
+
+
+@pytest.mark.asyncio
+async def test_small_responses_stay_inline():
+    class NoExecutor:
+        def submit(self, *args, **kwargs):
+            raise AssertionError("small bodies must not be offloaded")
+
+    offloader = DecodeOffloader(threshold=len(BODY) + 1, executor=NoExecutor())
+
+    leads = await offloader.decode_leads(BODY)
+
+    assert [lead.id for lead in leads] == list(range(50))
+
+
+@pytest.mark.asyncio
+async def test_repository_list_uses_offloader_when_configured():
+    client = NoCRMClient(api_key="key", subdomain="acme", transport=StaticTransport(),
+                         offload_threshold=100, offload_workers=1)
+    try:
+        leads = await client.repository.list()
+    finally:
+        await client.close()
+
+    assert len(leads) == 50
+    assert all(isinstance(lead, Lead) for lead in leads)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("body", [b"not json", b"[1, 2]"])
+async def test_undecodable_responses_raise_api_error(body):
+    client = NoCRMClient(api_key="key", subdomain="acme", transport=StaticTransport(body),
+                         offload_threshold=len(body) + 1, offload_workers=1)
+    try:
+        with pytest.raises(NoCRMAPIError, match="Invalid JSON response"):
+            await client.repository.list()
+    finally:
+        await client.close()
@@ -0,0 +1,187 @@
+import asyncio
+import random
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from nocrm_wrapper.cache import LeadDuplicateIndex
+from nocrm_wrapper.cache.duplicate_index import normalize, trigrams
+from nocrm_wrapper.models import Lead, LeadEvent
+from nocrm_wrapper.exceptions import NoCRMAPIError, NoCRMDuplicateLeadError
+from nocrm_wrapper.services.lead_importer import LeadImporter
+from nocrm_wrapper.services.lead_service import LeadService
+
+
+def _lead(id, title, contact=None):
+    return Lead(title=title, status="new", contact_name=contact, id=id)
+
+
+def _index():
+    index = LeadDuplicateIndex(threshold=0.6)
+    index.add_many([
+        _lead(1, "Implementación CRM", "Juan Pérez"),
+        _lead(2, "Website redesign", "ACME Corp"),
+    ])
+    return index
+
+
+def test_finds_exact_and_fuzzy_duplicates():
+    index = _index()
+
+    assert index.find_duplicates(Lead(title="implementacion  crm!", status="new",
+                                      contact_name="JUAN PEREZ")) == [(1, 1.0)]
+    [(id, similarity)] = index.find_duplicates(Lead(title="Website redesing", status="new",
+                                                    contact_name="Acme Corp"))
+    assert id == 2 and 0.6 <= similarity < 1.0
+    assert index.find_duplicates(Lead(title="Something else", status="new")) == []
+
+
+def test_apply_event_keeps_index_fresh():
+    index = _index()
+
+    index.apply_event(LeadEvent(type=LeadEvent.DELETED, lead=_lead(2, "Website redesign")))
+    index.apply_event(LeadEvent(type=LeadEvent.UPDATED, lead=_lead(1, "Mobile app", "Juan Pérez")))
+
+    assert 2 not in index
+    assert index.find_duplicates(_lead(None, "Implementación CRM", "Juan Pérez")) == []
+    assert index.find_duplicates(_lead(None, "Mobile app", "Juan Perez")) == [(1, 1.0)]
+
+
+def test_save_and_load_round_trip(tmp_path):
+    path = str(tmp_path / "leads.index.json")
+    _index().save(path)
+
+    loaded = LeadDuplicateIndex.load(path)
+
+    assert len(loaded) == 2
+    assert loaded.find_duplicates(_lead(None, "Website Redesign", "acme corp")) == [(2, 1.0)]
+
+
+WORDS = ["implementacion", "crm", "proyecto", "consultoria", "licencias", "soporte", "anual", "renovacion"]
+NAMES = ["juan", "maria", "ana", "pedro", "lucia", "carlos"]
+
+
+def _similar_leads(count, seed=0):
+    rng = random.Random(seed)
+    for id in range(1, count + 1):
+        unique = "".join(rng.choices("abcdefghij", k=rng.randint(0, 6)))
+        yield _lead(id, " ".join(rng.sample(WORDS, 3) + [unique]), " ".join(rng.sample(NAMES, 2)))
+
+
+def test_find_duplicates_matches_brute_force_jaccard():
+    leads = list(_similar_leads(600))
+    index = LeadDuplicateIndex(threshold=0.6)
+    index.add_many(leads)
+    grams = {lead.id: trigrams(f"{normalize(lead.title)} {normalize(lead.contact_name)}") for lead in leads}
+
+    for query in leads[:40]:
+        for threshold in (0.5, 0.7, 0.9):
+            expected = set()
+            for id, other in grams.items():
+                common = len(grams[query.id] & other)
+                if id != query.id and common / (len(grams[query.id]) + len(other) - common) >= threshold:
+                    expected.add(id)
+            found = index.find_duplicates(query, threshold=threshold, limit=len(leads))
+            assert {id for id, _ in found} == expected
+
+
+def test_query_cost_does_not_grow_with_common_words():
+    index = LeadDuplicateIndex(threshold=0.8)
+    index.add_many(_similar_leads(20000))
+    query = _lead(None, "Implementacion CRM soporte bdfhja", "Juan Maria")
+    grams = trigrams("implementacion crm soporte bdfhja juan maria")
+
+    # Sin el filtro de prefijo se verificarían todos los leads con alguna palabra en común
+    assert len(index._candidates(grams, 0.8)) < len(index) // 40
+    assert index.find_duplicates(query) == []
+
+
+@pytest.mark.asyncio
+async def test_create_lead_rejects_duplicates_without_api_call():
+    repository = MagicMock()
+    repository.create = AsyncMock(side_effect=lambda lead: _lead(3, lead.title, lead.contact_name))
+    service = LeadService(repository, duplicate_index=_index())
+
+    with pytest.raises(NoCRMDuplicateLeadError) as error:
+        await service.create_lead(Lead(title="Implementacion CRM", status="new", contact_name="Juan Perez"))
+    assert error.value.matches == [(1, 1.0)]
+    repository.create.assert_not_awaited()
+
+    created = await service.create_lead(Lead(title="Brand new deal", status="new"))
+    assert created.id in service.duplicate_index
+
+
+def test_reservations_match_until_released():
+    index = _index()
+    token = index.reserve(_lead(None, "Mobile app", "Globex"))
+    assert len(index) == 2
+    assert index.find_duplicates(_lead(None, "Mobile app", "Globex")) == [(None, 1.0)]
+
+    index.release(token)
+    assert index.find_duplicates(_lead(None, "Mobile app", "Globex")) == []
+
+
+def _slow_create(ids):
+    async def create(lead):
+        await asyncio.sleep(0)
+        return _lead(next(ids), lead.title, lead.contact_name)
+    return create
+
+
+@pytest.mark.asyncio
+async def test_concurrent_create_lead_calls_create_only_one_duplicate():
+    repository = MagicMock()
+    repository.create = AsyncMock(side_effect=_slow_create(iter(range(3, 10))))
+    service = LeadService(repository, duplicate_index=_index())
+
+    results = await asyncio.gather(
+        *(service.create_lead(Lead(title="Big Deal", status="new", contact_name="Ana")) for _ in range(3)),
+        return_exceptions=True
+    )
+
+    assert sum(isinstance(r, Lead) for r in results) == 1
+    assert sum(isinstance(r, NoCRMDuplicateLeadError) for r in results) == 2
+    assert repository.create.await_count == 1
+    assert service.duplicate_index.find_duplicates(_lead(None, "Big Deal", "Ana")) == [(3, 1.0)]
+
+
+@pytest.mark.asyncio
+async def test_prepare_lead_reserves_until_prepared_lead_is_created():
+    repository = MagicMock()
+    repository.create = AsyncMock(side_effect=lambda lead: _lead(3, lead.title, lead.contact_name))
+    service = LeadService(repository, duplicate_index=_index())
+    lead = Lead(title="Big Deal", status="new", contact_name="Ana")
+
+    reservation = service.prepare_lead(lead)
+    with pytest.raises(NoCRMDuplicateLeadError):
+        service.prepare_lead(lead)
+
+    created = await service.create_prepared_lead(lead, reservation)
+    assert service.duplicate_index.find_duplicates(lead) == [(created.id, 1.0)]
+
+
+@pytest.mark.asyncio
+async def test_failed_create_releases_reservation():
+    repository = MagicMock()
+    repository.create = AsyncMock(side_effect=NoCRMAPIError("boom", status_code=500))
+    service = LeadService(repository, duplicate_index=_index())
+
+    with pytest.raises(NoCRMAPIError):
+        await service.create_lead(Lead(title="Big Deal", status="new", contact_name="Ana"))
+    assert service.duplicate_index.find_duplicates(_lead(None, "Big Deal", "Ana")) == []
+
+
+@pytest.mark.asyncio
+async def test_import_with_concurrency_rejects_duplicate_rows(tmp_path):
+    source = tmp_path / "leads.csv"
+    source.write_text("title,status,contact_name\n" + "Big Deal,new,Ana\n" * 3)
+    repository = MagicMock()
+    repository.create = AsyncMock(side_effect=_slow_create(iter(range(3, 10))))
+    service = LeadService(repository, duplicate_index=_index())
+    importer = LeadImporter(service, checkpoint_path=str(tmp_path / "import.ckpt"),
+                            rejects_path=str(tmp_path / "rejects.ndjson"), concurrency=3)
+
+    result = await importer.run(str(source))
+
+    assert (result.created, result.rejected, result.failed) == (1, 2, 0)
+    assert repository.create.await_count == 1
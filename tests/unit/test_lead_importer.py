@@ -0,0 +1,152 @@
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from nocrm_wrapper.cache import LeadDuplicateIndex
+from nocrm_wrapper.exceptions.nocrm_exceptions import NoCRMAPIError
+from nocrm_wrapper.models.lead import Lead
+from nocrm_wrapper.services.lead_importer import LeadImporter
+from nocrm_wrapper.services.lead_service import LeadService
+
+CSV = """title,status,amount,probability,source
+Deal one,new,100,50,web
+x,new,10,10,web
+Deal three,new,-5,,web
+Deal four,new,300,,fair
+"""
+
+
+def _importer(tmp_path, create, duplicate_index=None):
+    repository = MagicMock()
+    repository.create = AsyncMock(side_effect=create)
+    service = LeadService(repository=repository, duplicate_index=duplicate_index)
+    importer = LeadImporter(
+        service,
+        checkpoint_path=str(tmp_path / "import.ckpt"),
+        rejects_path=str(tmp_path / "rejects.ndjson"),
+        concurrency=2,
+    )
+    return importer, repository
+
+
+@pytest.mark.asyncio
+async def test_import_creates_valid_rows_and_rejects_invalid(tmp_path):
+    source = tmp_path / "leads.csv"
+    source.write_text(CSV)
+    importer, repository = _importer(tmp_path, create=lambda lead: lead)
+
+    result = await importer.run(str(source))
+
+    assert (result.created, result.rejected, result.failed) == (2, 2, 0)
+    created = sorted((call.args[0] for call in repository.create.await_args_list), key=lambda l: l.title)
+    assert [lead.title for lead in created] == ["Deal four", "Deal one"]
+    assert [lead.custom_fields for lead in created] == [{"source": "fair"}, {"source": "web"}]
+    rejects = [json.loads(line) for line in (tmp_path / "rejects.ndjson").read_text().splitlines()]
+    assert [r["offset"] for r in rejects] == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_import_resumes_from_checkpoint_and_retries_failures(tmp_path):
+    source = tmp_path / "leads.ndjson"
+    source.write_text("\n".join(json.dumps({"title": f"Deal {i}", "status": "new"}) for i in range(4)))
+
+    def flaky(lead):
+        if lead.title == "Deal 2":
+            raise NoCRMAPIError("boom", status_code=500)
+        return lead
+
+    importer, _ = _importer(tmp_path, create=flaky)
+    first = await importer.run(str(source))
+    assert (first.created, first.failed) == (3, 1)
+
+    importer, repository = _importer(tmp_path, create=lambda lead: lead)
+    second = await importer.run(str(source))
+
+    assert (second.created, second.skipped) == (1, 3)
+    assert repository.create.await_args.args[0].title == "Deal 2"
+    assert importer.load_checkpoint() == {0, 1, 2, 3}
+
+
+def test_row_to_lead_converts_types():
+    lead = LeadImporter.row_to_lead({
+        "title": "Deal", "amount": "12.5", "probability": "40",
+        "expected_closing_date": "2030-01-01T00:00:00Z", "contact_name": "",
+    })
+
+    assert isinstance(lead, Lead)
+    assert (lead.status, lead.amount, lead.probability) == ("new", 12.5, 40)
+    assert lead.contact_name is None
+    assert lead.expected_closing_date.year == 2030
+
+
+@pytest.mark.asyncio
+async def test_import_rejects_malformed_ndjson_lines_without_aborting(tmp_path):
+    source = tmp_path / "leads.ndjson"
+    source.write_text("\n".join([
+        json.dumps({"title": "Deal one", "status": "new"}),
+        '{"title": "Broken',
+        json.dumps(["not", "an", "object"]),
+        json.dumps({"title": "Deal four", "custom_fields": "x"}),
+        json.dumps({"title": "Deal five", "custom_fields": '{"source": "web"}'}),
+    ]))
+    importer, repository = _importer(tmp_path, create=lambda lead: lead)
+
+    result = await importer.run(str(source))
+
+    assert (result.created, result.rejected, result.failed) == (2, 3, 0)
+    created = sorted(call.args[0].title for call in repository.create.await_args_list)
+    assert created == ["Deal five", "Deal one"]
+    rejects = [json.loads(line) for line in (tmp_path / "rejects.ndjson").read_text().splitlines()]
+    assert [r["offset"] for r in rejects] == [1, 2, 3]
+    assert importer.load_checkpoint() == {0, 1, 2, 3, 4}
+
+
+@pytest.mark.asyncio
+async def test_import_rejects_csv_row_with_invalid_custom_fields(tmp_path):
+    source = tmp_path / "leads.csv"
+    source.write_text("title,status,custom_fields\nDeal one,new,x\nDeal two,new,\n")
+    importer, repository = _importer(tmp_path, create=lambda lead: lead)
+
+    result = await importer.run(str(source))
+
+    assert (result.created, result.rejected) == (1, 1)
+    [reject] = [json.loads(line) for line in (tmp_path / "rejects.ndjson").read_text().splitlines()]
+    assert reject["offset"] == 0
+    assert "custom_fields" in reject["error"]
+
+
+@pytest.mark.asyncio
+async def test_import_rejects_non_string_text_fields(tmp_path):
+    source = tmp_path / "leads.ndjson"
+    source.write_text("\n".join(json.dumps(row) for row in [
+        {"title": "Big deal", "contact_name": 5},
+        {"title": "Other deal", "status": ["new"]},
+        {"title": 12345},
+        {"title": "Last deal", "description": "ok"},
+    ]))
+    importer, repository = _importer(tmp_path, create=lambda lead: lead, duplicate_index=LeadDuplicateIndex())
+
+    result = await importer.run(str(source))
+
+    assert (result.created, result.rejected) == (1, 3)
+    assert repository.create.await_args.args[0].title == "Last deal"
+    assert importer.load_checkpoint() == {0, 1, 2, 3}
+
+
+@pytest.mark.asyncio
+async def test_import_counts_unexpected_create_errors_as_failed(tmp_path, caplog):
+    source = tmp_path / "leads.ndjson"
+    source.write_text("\n".join(json.dumps({"title": f"Deal {i}", "status": "new"}) for i in range(3)))
+
+    def odd_response(lead):
+        if lead.title == "Deal 1":
+            raise TypeError("unexpected response")
+        return lead
+
+    importer, _ = _importer(tmp_path, create=odd_response)
+    result = await importer.run(str(source))
+
+    assert (result.created, result.failed) == (2, 1)
+    assert importer.load_checkpoint() == {0, 2}
+    assert "row 1 failed unexpectedly" in caplog.text
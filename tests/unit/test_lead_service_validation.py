@@ -47,3 +47,31 @@ def test_validate_lead_rejects_expected_closing_date_in_past():
 
     with pytest.raises(NoCRMValidationError):
         service._validate_lead(lead)
+
+
+def test_validate_many_reports_all_errors_per_lead():
+    service = _service()
+    now = datetime(2026, 1, 1)
+    leads = [
+        Lead(title="Valid", status="new", amount=10, probability=50,
+             expected_closing_date=now + timedelta(days=1)),
+        Lead(title="a", status="new", amount=-1, probability=101,
+             expected_closing_date=now - timedelta(days=1)),
+        Lead(title="Valid", status="new", probability=-5),
+    ]
+
+    report = service.validate_many(leads, now=now)
+
+    assert report[0] == []
+    assert len(report[1]) == 4
+    assert len(report[2]) == 1
+
+
+def test_validate_many_matches_single_lead_validation():
+    service = _service()
+    lead = Lead(title="Valid", status="new", amount=-1)
+
+    [errors] = service.validate_many([lead])
+
+    with pytest.raises(NoCRMValidationError, match=errors[0]):
+        service._validate_lead(lead)
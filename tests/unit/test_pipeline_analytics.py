@@ -0,0 +1,61 @@
+from datetime import datetime, timedelta, timezone
+
+from nocrm_wrapper.analytics import PipelineAnalytics
+from nocrm_wrapper.models import Lead, LeadEvent
+
+NOW = datetime(2026, 6, 1, tzinfo=timezone.utc)
+STEPS = [{"name": "new", "pipeline_id": 1}, {"name": "won", "pipeline_id": 1}]
+PIPELINES = [{"id": 1, "name": "Sales"}]
+
+
+def _lead(id, status="new", amount=100.0, probability=50, age_days=1, updated_hours_ago=None):
+    updated_at = NOW - timedelta(hours=updated_hours_ago) if updated_hours_ago is not None else None
+    return Lead(title=f"Deal {id}", status=status, amount=amount, probability=probability,
+                id=id, created_at=NOW - timedelta(days=age_days), updated_at=updated_at)
+
+
+def test_aggregates_by_step_and_pipeline():
+    analytics = PipelineAnalytics(STEPS, PIPELINES)
+    analytics.apply_many([_lead(1), _lead(2, amount=200.0, age_days=40), _lead(3, status="won", probability=100)])
+
+    steps = analytics.by_step(now=NOW)
+    assert steps["new"]["count"] == 2
+    assert steps["new"]["weighted"] == 150.0
+    assert steps["new"]["age_histogram"] == {"<7d": 1, "7-30d": 0, "30-90d": 1, "90-180d": 0, ">=180d": 0}
+
+    pipeline = analytics.by_pipeline(now=NOW)[1]
+    assert pipeline["name"] == "Sales"
+    assert (pipeline["count"], pipeline["amount"], pipeline["weighted"]) == (3, 400.0, 250.0)
+
+
+def test_updates_replace_previous_contribution():
+    analytics = PipelineAnalytics(STEPS, PIPELINES)
+    analytics.apply(_lead(1))
+
+    analytics.apply_event(LeadEvent(type=LeadEvent.UPDATED, lead=_lead(1, status="won", probability=100)))
+
+    steps = analytics.by_step(now=NOW)
+    assert "new" not in steps
+    assert steps["won"]["weighted"] == 100.0
+    assert analytics.by_pipeline(now=NOW)[1]["count"] == 1
+
+
+def test_out_of_order_events_do_not_restore_older_state():
+    analytics = PipelineAnalytics(STEPS, PIPELINES)
+    analytics.apply(_lead(1, status="won", probability=100, updated_hours_ago=1))
+
+    analytics.apply_event(LeadEvent(type=LeadEvent.UPDATED, lead=_lead(1, status="new", updated_hours_ago=2)))
+
+    steps = analytics.by_step(now=NOW)
+    assert "new" not in steps
+    assert steps["won"]["count"] == 1
+
+
+def test_deleted_event_removes_lead():
+    analytics = PipelineAnalytics(STEPS, PIPELINES)
+    analytics.apply(_lead(1))
+
+    analytics.apply_event(LeadEvent(type=LeadEvent.DELETED, lead=_lead(1)))
+
+    assert len(analytics) == 0
+    assert analytics.by_pipeline(now=NOW) == {}
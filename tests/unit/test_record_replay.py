@@ -0,0 +1,68 @@
+import json
+
+import pytest
+
+from nocrm_wrapper.nocrm_client import NoCRMClient
+from nocrm_wrapper.transport import (
+    Cassette, LoadGenerator, RecordingTransport, ReplayTransport, Transport, TransportResponse,
+)
+
+
+class FakeTransport(Transport):
+    def __init__(self):
+        self.calls = 0
+
+    async def request(self, method, url, headers, json=None, params=None, timeout=None):
+        self.calls += 1
+        body = {"id": self.calls, "title": "Deal", "status": "new"}
+        return TransportResponse(status=200, body=_dumps(body))
+
+
+def _dumps(value):
+    return json.dumps(value).encode()
+
+
+@pytest.mark.asyncio
+async def test_record_then_replay_offline(tmp_path):
+    recorder = RecordingTransport(FakeTransport())
+    client = NoCRMClient(api_key="secret-key", subdomain="acme", transport=recorder)
+    await client.repository.get(1)
+    await client.repository.get(1)
+    await client.repository._make_request("GET", "leads", params={"api_key": "secret-key"})
+
+    path = tmp_path / "trace.ndjson.gz"
+    recorder.cassette.save(str(path))
+    cassette = Cassette.load(str(path))
+
+    assert len(cassette.interactions) == 3
+    assert cassette.interactions[0].path == "/api/v2/leads/1"
+    assert cassette.interactions[2].params == {"api_key": "REDACTED"}
+
+    replay = NoCRMClient(api_key="other-key", subdomain="other", transport=ReplayTransport(cassette, latency_scale=0))
+    first = await replay.repository.get(1)
+    second = await replay.repository.get(1)
+    assert (first.id, second.id) == (1, 2)
+    await replay.repository._make_request("GET", "leads", params={"api_key": "other-key"})
+
+
+@pytest.mark.asyncio
+async def test_replay_raises_for_unknown_request():
+    client = NoCRMClient(api_key="key", subdomain="acme", transport=ReplayTransport(Cassette()))
+
+    with pytest.raises(LookupError):
+        await client.repository.get(1)
+
+
+@pytest.mark.asyncio
+async def test_load_generator_replays_trace_at_speed():
+    recorder = RecordingTransport(FakeTransport())
+    client = NoCRMClient(api_key="key", subdomain="acme", transport=recorder)
+    for id in range(5):
+        await client.repository.get(id)
+
+    target = NoCRMClient(api_key="key", subdomain="acme",
+                         transport=ReplayTransport(recorder.cassette, latency_scale=0))
+    report = await LoadGenerator(target.repository, recorder.cassette, speed=100).run()
+
+    assert (report.requests, report.errors) == (5, 0)
+    assert report.p50 <= report.p99 <= report.max
@@ -0,0 +1,96 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from nocrm_wrapper.config import NoCRMConfig
+from nocrm_wrapper.models import User
+from nocrm_wrapper.nocrm_client import NoCRMClient
+from nocrm_wrapper.repositories import RequestMetrics, ResourceRepository, ResourceSpec
+from nocrm_wrapper.repositories.resources import USERS
+
+
+def _repository(spec=USERS, responses=None, **options):
+    options.setdefault("cache_ttl", 60)
+    config = NoCRMConfig(api_key="key", subdomain="acme", **options)
+    repository = ResourceRepository(config, spec, metrics=RequestMetrics())
+    repository._send = AsyncMock(side_effect=responses)
+    return repository
+
+
+@pytest.mark.asyncio
+async def test_list_all_walks_offset_pages():
+    spec = ResourceSpec(name="users", endpoint="users", model=User, page_size=2)
+    repository = _repository(spec, responses=[
+        [{"id": 1, "email": "a@x.io"}, {"id": 2, "email": "b@x.io"}],
+        [{"id": 3, "email": "c@x.io"}],
+    ])
+
+    users = await repository.list_all()
+
+    assert [u.id for u in users] == [1, 2, 3]
+    second_call = repository._send.await_args_list[1]
+    assert second_call.args[3] == {"limit": 2, "offset": 2}
+
+
+@pytest.mark.asyncio
+async def test_get_uses_cache_and_records_metrics():
+    repository = _repository(responses=[{"id": 7, "email": "a@x.io", "unknown": 1}])
+
+    first = await repository.get(7)
+    second = await repository.get(7)
+
+    assert first == second and first is not second
+    assert repository._send.await_count == 1
+    snapshot = repository.metrics.snapshot()
+    assert snapshot["requests"]["GET users"]["count"] == 1
+    assert snapshot["cache"]["users"] == {"hits": 1, "misses": 1}
+
+
+@pytest.mark.asyncio
+async def test_get_many_skips_cached_ids():
+    repository = _repository(responses=[{"id": 1}, {"id": 2}])
+    repository.cache.set(3, User(id=3))
+
+    users = await repository.get_many([1, 2, 3])
+
+    assert [u.id for u in users] == [1, 2, 3]
+    assert repository._send.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_list_caches_results_with_unhashable_filters():
+    repository = _repository(responses=[[{"id": 1}], [{"id": 2}]])
+
+    first = await repository.list(ids=[1, 2], extra={"team": 3})
+    second = await repository.list(extra={"team": 3}, ids=[1, 2])
+    other = await repository.list(ids=[2])
+
+    assert [u.id for u in first] == [u.id for u in second] == [1]
+    assert [u.id for u in other] == [2]
+    assert repository._send.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_cache_is_opt_in_bounded_and_returns_copies():
+    assert _repository(cache_ttl=None).cache is None
+
+    repository = _repository(responses=[[{"id": 1, "email": "a@x.io"}]], cache_maxsize=2)
+    assert (repository.cache.ttl, repository.cache.maxsize) == (60, 2)
+
+    users = await repository.list()
+    users[0].email = "changed@x.io"
+    users.clear()
+
+    assert [u.email for u in await repository.list()] == ["a@x.io"]
+    assert repository._send.await_count == 1
+
+
+def test_client_creates_resource_repositories_lazily():
+    client = NoCRMClient(api_key="key", subdomain="acme")
+
+    assert "users" not in vars(client)
+    users = client.users
+    assert isinstance(users, ResourceRepository)
+    assert client.users is users
+    with pytest.raises(AttributeError):
+        client.unknown_resource
@@ -0,0 +1,36 @@
+import asyncio
+import json
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from nocrm_wrapper.services.sharded_sync import NDJSONExportSink, ShardedLeadSync
+
+LEADS = [{"id": i, "title": f"Deal {i}", "status": "new", "updated_at": "2026-01-01T00:00:00Z"}
+         for i in range(25)]
+
+
+async def _list_leads(request):
+    limit = int(request.query["limit"])
+    offset = int(request.query["offset"])
+    return web.json_response(LEADS[offset:offset + limit])
+
+
+@pytest.mark.asyncio
+async def test_sharded_sync_merges_all_pages_into_sink(tmp_path):
+    app = web.Application()
+    app.router.add_get("/api/v2/leads", _list_leads)
+    output = tmp_path / "leads.ndjson"
+
+    async with TestServer(app) as server:
+        sync = ShardedLeadSync(api_key="key", subdomain="acme", workers=2, rate_limit=100,
+                               page_size=10, start_method="spawn",
+                               base_url=str(server.make_url("/api/v2")))
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(None, sync.run, NDJSONExportSink(str(output)))
+
+    exported = [json.loads(line) for line in output.read_text().splitlines()]
+    assert sorted(lead["id"] for lead in exported) == list(range(25))
+    assert (result.leads, result.pages) == (25, 3)
+    assert result.per_shard == {0: 15, 1: 10}
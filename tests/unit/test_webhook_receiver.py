@@ -0,0 +1,112 @@
+import json
+from datetime import datetime, timezone
+
+import pytest
+from aiohttp.test_utils import TestClient, TestServer
+
+from nocrm_wrapper.cache import TTLCache
+from nocrm_wrapper.models import Lead, LeadEvent
+from nocrm_wrapper.webhooks import WebhookReceiver
+
+
+def _payload(event, **lead_data):
+    data = {"id": 1, "title": "Deal", "status": "new"}
+    data.update(lead_data)
+    return {"webhook_event": {"id": 99, "event": event, "data": data}}
+
+
+async def _post(receiver, payload, signature=None):
+    body = json.dumps(payload).encode()
+    headers = {}
+    if signature is None and receiver.secret is not None:
+        signature = receiver.sign(body)
+    if signature is not None:
+        headers[receiver.signature_header] = signature
+
+    async with TestClient(TestServer(receiver.make_app())) as client:
+        response = await client.post(receiver.path, data=body, headers=headers)
+        return response.status
+
+
+@pytest.mark.asyncio
+async def test_webhook_updates_cache_and_notifies_subscribers():
+    receiver = WebhookReceiver(secret="s3cr3t")
+    cache = TTLCache(ttl=60)
+    cache.set(1, Lead(title="Old", status="new", id=1))
+    receiver.attach(cache)
+    received = []
+
+    @receiver.subscribe
+    async def on_event(event):
+        received.append(event)
+
+    status = await _post(receiver, _payload("lead.step.changed", title="Deal", status="won"))
+
+    assert status == 200
+    assert received[0].type == LeadEvent.UPDATED
+    assert cache.get(1).status == "won"
+
+
+@pytest.mark.asyncio
+async def test_webhook_deleted_event_invalidates_cache():
+    receiver = WebhookReceiver(allow_unsigned=True)
+    cache = TTLCache(ttl=60)
+    cache.set(1, Lead(title="Deal", status="new", id=1))
+    receiver.attach(cache)
+
+    status = await _post(receiver, _payload("lead.deleted"))
+
+    assert status == 200
+    assert 1 not in cache
+
+
+@pytest.mark.asyncio
+async def test_webhook_rejects_invalid_signature():
+    receiver = WebhookReceiver(secret="s3cr3t")
+    received = []
+    receiver.subscribe(received.append)
+
+    status = await _post(receiver, _payload("lead.creation"), signature="bad")
+
+    assert status == 401
+    assert received == []
+
+
+def test_receiver_requires_secret_unless_unsigned_is_allowed():
+    with pytest.raises(ValueError):
+        WebhookReceiver()
+
+    assert WebhookReceiver(secret="s3cr3t").verify(b"{}", None) is False
+    assert WebhookReceiver(allow_unsigned=True).verify(b"{}", None) is True
+
+
+def test_parse_ignores_non_lead_events():
+    receiver = WebhookReceiver(allow_unsigned=True)
+
+    assert receiver.parse({"webhook_event": {"event": "user.creation", "data": {}}}) is None
+    assert receiver.parse(_payload("lead.creation")).type == LeadEvent.CREATED
+
+
+def test_ttl_cache_expires_entries():
+    now = [0.0]
+    cache = TTLCache(ttl=10, clock=lambda: now[0])
+    cache.set("key", "value")
+
+    assert cache.get("key") == "value"
+    now[0] = 11
+    assert cache.get("key") is None
+
+
+def test_ttl_cache_events_refresh_only_cached_leads_and_skip_stale_updates():
+    cache = TTLCache(ttl=60)
+    newer = datetime(2024, 1, 2, tzinfo=timezone.utc)
+    older = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    cache.set(1, Lead(title="Deal", status="won", id=1, updated_at=newer))
+
+    cache.apply_event(LeadEvent(type=LeadEvent.UPDATED,
+                                lead=Lead(title="Deal", status="new", id=1, updated_at=older)))
+    cache.apply_event(LeadEvent(type=LeadEvent.CREATED, lead=Lead(title="Other", status="new", id=2)))
+
+    assert cache.get(1).status == "won"
+    assert 2 not in cache
+    assert len(cache) == 1